@@ -1,4 +1,5 @@
 CREATE DATABASE jobs_db;
 \c jobs_db;
 
-CREATE EXTENSION IF NOT EXISTS "uuid-ossp"; 
\ No newline at end of file
+CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+CREATE EXTENSION IF NOT EXISTS pg_trgm; 
\ No newline at end of file
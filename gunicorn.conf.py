@@ -0,0 +1,16 @@
+"""
+Gunicorn settings for the Job Search API.
+
+Run with: gunicorn src.server:app -c gunicorn.conf.py
+"""
+
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+# Workers inherit this and split DB_MAX_CONNECTIONS between them
+os.environ["GUNICORN_WORKERS"] = str(workers)
+worker_connections = 1000
+
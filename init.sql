@@ -24,4 +24,5 @@ $do$;
 \c jobs_db;
 
 -- Create extension if needed
-CREATE EXTENSION IF NOT EXISTS "uuid-ossp"; 
\ No newline at end of file
+CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+CREATE EXTENSION IF NOT EXISTS pg_trgm; 
\ No newline at end of file
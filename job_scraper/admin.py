@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib import messages
-from django.http import HttpResponse, HttpResponseRedirect
+from django.http import FileResponse, HttpResponseRedirect
 from django.urls import path, reverse
 from django.template.response import TemplateResponse
 from django.utils import timezone
@@ -73,13 +73,14 @@ class ResumeAdmin(admin.ModelAdmin):
                         cwd=temp_dir
                     )
                 
-                # Read the generated PDF
+                # Stream the generated PDF in chunks. The open handle keeps the
+                # file readable after the temporary directory is removed, and
+                # FileResponse closes it once the response has been sent.
                 pdf_path = os.path.join(temp_dir, 'resume.pdf')
-                with open(pdf_path, 'rb') as pdf_file:
-                    response = HttpResponse(pdf_file.read(), content_type='application/pdf')
-                    # Change to inline to display in browser
-                    response['Content-Disposition'] = f'inline; filename="{os.path.basename(resume.file.name).replace(".tex", ".pdf")}"'
-                    return response
+                response = FileResponse(open(pdf_path, 'rb'), content_type='application/pdf')
+                # Change to inline to display in browser
+                response['Content-Disposition'] = f'inline; filename="{os.path.basename(resume.file.name).replace(".tex", ".pdf")}"'
+                return response
                     
         except Resume.DoesNotExist:
             messages.error(request, "Resume not found.")
@@ -349,25 +350,38 @@ class TelegramChannelAdmin(admin.ModelAdmin):
             success_count = 0
             error_count = 0
             
+            channels = []
             for channel in queryset:
                 if not channel.is_active:
                     messages.warning(request, f"Channel {channel.channel_name} is not active. Skipping.")
                     continue
-                
-                try:
-                    new_jobs = client.scrape_channel(channel.channel_name)
-                    success_count += new_jobs
-                    update_channel_last_scraped(channel)
-                    messages.success(request, f"Successfully scraped {new_jobs} new jobs from {channel.channel_name}")
-                except ValueError as ve:
-                    if "authentication required" in str(ve).lower():
+                channels.append(channel)
+            
+            # Channels are fetched concurrently; results come back per channel
+            try:
+                results = client.scrape_channels(channel.channel_name for channel in channels)
+            except ValueError as ve:
+                if "authentication required" in str(ve).lower():
+                    return HttpResponseRedirect(
+                        reverse('admin:job_scraper_telegramchannel_verify')
+                    )
+                raise
+            
+            for channel in channels:
+                result = results[channel.channel_name]
+                if isinstance(result, ValueError):
+                    if "authentication required" in str(result).lower():
                         return HttpResponseRedirect(
                             reverse('admin:job_scraper_telegramchannel_verify')
                         )
-                    messages.error(request, f"Error with channel {channel.channel_name}: {str(ve)}")
-                except Exception as e:
+                    messages.error(request, f"Error with channel {channel.channel_name}: {str(result)}")
+                elif isinstance(result, Exception):
                     error_count += 1
-                    messages.error(request, f"Error scraping {channel.channel_name}: {str(e)}")
+                    messages.error(request, f"Error scraping {channel.channel_name}: {str(result)}")
+                else:
+                    success_count += result
+                    update_channel_last_scraped(channel)
+                    messages.success(request, f"Successfully scraped {result} new jobs from {channel.channel_name}")
             
             if success_count:
                 messages.success(request, f"Successfully scraped {success_count} new jobs")
@@ -1,16 +1,38 @@
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from pydantic import BaseModel
 import uvicorn
 from typing import Optional, List
 from src.gemini_model import GeminiModel
 from src.telegram_client import TelegramJobClient
-from src.models.database import get_db, Job, TelegramChannel
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, desc, text
+from src.models.database import (
+    get_db,
+    Job,
+    TelegramChannel,
+    ScrapeTask,
+    ServiceStatus,
+    AsyncSessionLocal,
+    SCRAPE_TASK_LOCK_KEY,
+    init_db,
+    release_job_monitor_lock,
+    try_acquire_job_monitor_lock,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete, func, or_, desc, text, tuple_
+from sqlalchemy.dialects.postgresql import array, insert
 import asyncio
-from datetime import datetime
+import base64
+import json
+import logging
+import time
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="Job Search API",
@@ -18,20 +40,66 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",  # Swagger UI endpoint
     redoc_url="/redoc",  # ReDoc endpoint
+    default_response_class=ORJSONResponse,
 )
 
-# Enable CORS
+# Enable CORS for the configured frontend origins only
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=os.getenv("CORS_ALLOW_ORIGINS", "http://localhost:8000").split(","),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
+# Job listings carry whole message texts, which compress well
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Initialize services
 gemini_model = None
 telegram_client = None
+# Held by the one worker process that runs the job monitor, which every
+# worker's job_monitor_runner keeps trying to take
+job_monitor_lock = None
+job_monitor_runner = None
+# Seconds between attempts to take the job monitor lock, and between the
+# holder's Telegram status reports; older reports count as no holder
+JOB_MONITOR_LOCK_RETRY_INTERVAL = 30
+TELEGRAM_STATUS_MAX_AGE = 3 * JOB_MONITOR_LOCK_RETRY_INTERVAL
+
+# Runs queued manual scrapes in the worker holding job_monitor_lock
+scrape_task_runner = None
+# Seconds between checks for queued scrapes, and how long finished ones are
+# kept for polling before they are deleted
+SCRAPE_TASK_POLL_INTERVAL = 2
+SCRAPE_TASK_TTL = float(os.getenv("SCRAPE_TASK_TTL", "3600"))
+# Seconds a task may wait for the lock holder before it is failed, so a
+# missing holder cannot leave it pending and block new scrapes forever
+SCRAPE_TASK_PENDING_TIMEOUT = 300
+
+# Bounds the Gemini requests in flight so bursts of /ai/analyze calls queue
+# here instead of filling the default thread pool
+gemini_semaphore = asyncio.Semaphore(int(os.getenv("GEMINI_CONCURRENCY", "8")))
+
+# Read-mostly responses cached per process as key -> (expires_at, value).
+# Writes made through the API clear it; scraper writes age out with the TTL.
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "30"))
+response_cache = {}
+
+
+def _get_cached(key: str):
+    """Return the cached value for key, or None if missing or expired"""
+    entry = response_cache.get(key)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry[1]
+
+
+def _set_cached(key: str, value):
+    response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL, value)
+    return value
 
 
 class JobResponse(BaseModel):
@@ -53,219 +121,93 @@ class JobResponse(BaseModel):
     telegram_forwards: Optional[int]
 
 
-@app.get("/", response_class=HTMLResponse)
-async def root(
-    page: int = Query(1, ge=1),
-    per_page: int = Query(10, ge=1, le=50),
-    db: Session = Depends(get_db),
-):
-    """Dashboard page with job cards and controls"""
-    # Check Telegram client status
-    telegram_status = "disconnected"
-    telegram_error = None
-    if telegram_client:
-        try:
-            is_authorized = await telegram_client.client.is_user_authorized()
-            telegram_status = "connected" if is_authorized else "unauthorized"
-        except Exception as e:
-            telegram_status = "error"
-            telegram_error = str(e)
-
-    # Get service status
-    service_status = {
-        "telegram": {"status": telegram_status, "error": telegram_error},
-        "database": {"status": "connected", "error": None},
-    }
-
-    try:
-        db.execute(text("SELECT 1"))
-    except Exception as e:
-        service_status["database"]["status"] = "error"
-        service_status["database"]["error"] = str(e)
+# Columns behind JobResponse, in field order and labelled with the field names
+JOB_RESPONSE_COLUMNS = (
+    Job.job_id.label("id"),
+    Job.title,
+    Job.company_name.label("company"),
+    Job.location,
+    # Use raw text instead of processed description
+    Job.telegram_raw_text.label("description"),
+    Job.url,
+    Job.remote,
+    Job.salary_min,
+    Job.salary_max,
+    Job.currency,
+    Job.categories,
+    Job.telegram_channel_name.label("telegram_channel"),
+    Job.telegram_message_date,
+    Job.telegram_views,
+    Job.telegram_forwards,
+)
+_JOB_RESPONSE_FIELDS = tuple(column.key for column in JOB_RESPONSE_COLUMNS)
 
-    # Add status alert HTML
-    status_alerts = []
-    if service_status["telegram"]["status"] != "connected":
-        alert_type = (
-            "warning"
-            if service_status["telegram"]["status"] == "unauthorized"
-            else "danger"
-        )
-        status_alerts.append(
-            f"""
-        <div class="alert alert-{alert_type} alert-dismissible fade show" role="alert">
-            <strong>Telegram Status:</strong> {service_status["telegram"]["status"]}
-            {f'<br><small>{service_status["telegram"]["error"]}</small>' if service_status["telegram"]["error"] else ''}
-            <button type="button" class="btn-close" data-bs-dismiss="alert" aria-label="Close"></button>
-        </div>
-        """
-        )
 
-    if service_status["database"]["status"] != "connected":
-        status_alerts.append(
-            f"""
-        <div class="alert alert-danger alert-dismissible fade show" role="alert">
-            <strong>Database Status:</strong> {service_status["database"]["status"]}
-            {f'<br><small>{service_status["database"]["error"]}</small>' if service_status["database"]["error"] else ''}
-            <button type="button" class="btn-close" data-bs-dismiss="alert" aria-label="Close"></button>
-        </div>
-        """
-        )
+def _job_response(row) -> dict:
+    """Build a JobResponse-shaped dict from a row starting with JOB_RESPONSE_COLUMNS
 
-    # Add status indicators to the header
-    status_indicators = f"""
-    <div class="d-flex gap-2 align-items-center mb-3">
-        <div class="d-flex align-items-center">
-            <span class="badge rounded-pill bg-{'success' if service_status['telegram']['status'] == 'connected' else 'warning' if service_status['telegram']['status'] == 'unauthorized' else 'danger'} me-2">
-                Telegram: {service_status["telegram"]["status"]}
-            </span>
-            <span class="badge rounded-pill bg-{'success' if service_status['database']['status'] == 'connected' else 'danger'} me-2">
-                Database: {service_status["database"]["status"]}
-            </span>
-        </div>
-    </div>
+    The routes returning these declare no response_model, so the dicts go
+    straight to ORJSONResponse without pydantic validation or serialization.
+    JobResponse still documents the shape in the OpenAPI schema.
     """
+    return dict(zip(_JOB_RESPONSE_FIELDS, row))
 
-    print("\n=== Loading Dashboard ===")
 
-    # Get jobs with pagination
-    offset = (page - 1) * per_page
-    total_jobs = db.query(Job).count()
-    print(f"Total jobs in database: {total_jobs}")
-
-    total_pages = (total_jobs + per_page - 1) // per_page
-    print(f"Total pages: {total_pages} (per_page: {per_page})")
-
-    print(f"Loading page {page} with offset {offset}")
-    jobs = (
-        db.query(Job)
-        .order_by(desc(Job.telegram_message_date))
-        .offset(offset)
-        .limit(per_page)
-        .all()
-    )
-    print(f"Retrieved {len(jobs)} jobs for current page")
-
-    # Print some details about the jobs
-    for job in jobs:
-        print(
-            f"Job ID: {job.job_id}, Title: {job.title}, Date: {job.telegram_message_date}"
-        )
-
-    # Get channels
-    channels = db.query(TelegramChannel).order_by(TelegramChannel.channel_name).all()
-    print(f"Retrieved {len(channels)} channels")
-
-    # Generate page links
-    page_links = []
-    for p in range(max(1, page - 2), min(total_pages + 1, page + 3)):
-        page_links.append(
-            f'<li class="page-item {"active" if p == page else ""}"><a class="page-link" href="/?page={p}">{p}</a></li>'
-        )
-
-    print("=== Dashboard Loading Complete ===\n")
-
-    # Generate job cards HTML
-    job_cards = []
-    for job in jobs:
-        telegram_link = job.url
-        job_date = job.telegram_message_date.strftime("%Y-%m-%d %H:%M:%S")
-
-        card_html = f"""
-        <div class="card mb-4" id="job-{job.job_id}">
-            <div class="card-header d-flex justify-content-between align-items-center">
-                <h5 class="card-title mb-0">{job.title}</h5>
-                <div class="d-flex gap-2 align-items-center">
-                    <span class="badge bg-primary">{job.telegram_channel_name}</span>
-                    <button 
-                        onclick="deleteJob('{job.job_id}')" 
-                        class="btn btn-sm btn-outline-danger"
-                        title="Delete job"
-                    >
-                        <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" fill="currentColor" class="bi bi-trash" viewBox="0 0 16 16">
-                            <path d="M5.5 5.5A.5.5 0 0 1 6 6v6a.5.5 0 0 1-1 0V6a.5.5 0 0 1 .5-.5m2.5 0a.5.5 0 0 1 .5.5v6a.5.5 0 0 1-1 0V6a.5.5 0 0 1 .5-.5m3 .5a.5.5 0 0 0-1 0v6a.5.5 0 0 0 1 0z"/>
-                            <path d="M14.5 3a1 1 0 0 1-1 1H13v9a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V4h-.5a1 1 0 0 1-1-1V2a1 1 0 0 1 1-1H6a1 1 0 0 1 1-1h2a1 1 0 0 1 1 1h3.5a1 1 0 0 1 1 1zM4.118 4 4 4.059V13a1 1 0 0 0 1 1h6a1 1 0 0 0 1-1V4.059L11.882 4zM2.5 3h11V2h-11z"/>
-                        </svg>
-                    </button>
-                </div>
-            </div>
-            <div class="card-body">
-                <div class="mb-3" style="white-space: pre-wrap;">{job.telegram_raw_text}</div>
-                <div class="d-flex justify-content-between align-items-center">
-                    <div>
-                        <small class="text-muted">Posted: {job_date}</small>
-                        {f'<br><small class="text-muted">Views: {job.telegram_views}</small>' if job.telegram_views else ''}
-                        {f'<br><small class="text-muted">Forwards: {job.telegram_forwards}</small>' if job.telegram_forwards else ''}
-                    </div>
-                    <a href="{telegram_link}" target="_blank" class="btn btn-sm btn-outline-primary">
-                        View on Telegram
-                    </a>
-                </div>
-            </div>
-            <div class="card-footer">
-                <div class="d-flex flex-wrap gap-2">
-                    {'<span class="badge bg-success">Remote</span>' if job.remote else ''}
-                    {' '.join(f'<span class="badge bg-info">{cat}</span>' for cat in (job.categories or []))}
-                </div>
-            </div>
-        </div>
-        """
-        job_cards.append(card_html)
-
-    return f"""
+# Static page chrome for the dashboard, rendered once at import time
+_DASHBOARD_HEAD = """
     <html>
         <head>
             <title>Job Scraper Dashboard</title>
             <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
             <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
             <style>
-                .card {{ box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-                .badge {{ margin-right: 4px; }}
-                pre {{ white-space: pre-wrap; }}
-                #scrapeStatus {{ display: none; }}
-                .alert-floating {{
+                .card { box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+                .badge { margin-right: 4px; }
+                pre { white-space: pre-wrap; }
+                #scrapeStatus { display: none; }
+                .alert-floating {
                     position: fixed;
                     top: 20px;
                     right: 20px;
                     z-index: 1050;
                     min-width: 300px;
                     max-width: 500px;
-                }}
-                .status-indicator {{
+                }
+                .status-indicator {
                     width: 10px;
                     height: 10px;
                     border-radius: 50%;
                     display: inline-block;
                     margin-right: 5px;
-                }}
-                .status-connected {{ background-color: #28a745; }}
-                .status-error {{ background-color: #dc3545; }}
-                .status-warning {{ background-color: #ffc107; }}
+                }
+                .status-connected { background-color: #28a745; }
+                .status-error { background-color: #dc3545; }
+                .status-warning { background-color: #ffc107; }
             </style>
             <script>
-                function showAlert(message, type = 'info') {{
+                function showAlert(message, type = 'info') {
                     const alertDiv = document.createElement('div');
-                    alertDiv.className = `alert alert-${{type}} alert-dismissible fade show alert-floating`;
+                    alertDiv.className = `alert alert-${type} alert-dismissible fade show alert-floating`;
                     alertDiv.innerHTML = `
-                        ${{message}}
+                        ${message}
                         <button type="button" class="btn-close" data-bs-dismiss="alert" aria-label="Close"></button>
                     `;
                     document.body.appendChild(alertDiv);
                     
                     // Auto-dismiss after 5 seconds
-                    setTimeout(() => {{
+                    setTimeout(() => {
                         alertDiv.classList.remove('show');
                         setTimeout(() => alertDiv.remove(), 150);
-                    }}, 5000);
-                }}
+                    }, 5000);
+                }
 
-                async function deleteJob(jobId) {{
+                async function deleteJob(jobId) {
                     if (!confirm('Are you sure you want to delete this job?')) return;
                     
-                    try {{
-                        const response = await fetch(`/jobs/${{jobId}}`, {{
+                    try {
+                        const response = await fetch(`/jobs/${jobId}`, {
                             method: 'DELETE'
-                        }});
+                        });
                         
                         if (!response.ok) throw new Error('Failed to delete job');
                         
@@ -273,16 +215,16 @@ async def root(
                         showAlert('Job deleted successfully', 'success');
                         
                         // Remove the job card from the UI
-                        const jobCard = document.getElementById(`job-${{jobId}}`);
-                        if (jobCard) {{
+                        const jobCard = document.getElementById(`job-${jobId}`);
+                        if (jobCard) {
                             jobCard.remove();
-                        }}
-                    }} catch (error) {{
-                        showAlert(`Error deleting job: ${{error.message}}`, 'danger');
-                    }}
-                }}
+                        }
+                    } catch (error) {
+                        showAlert(`Error deleting job: ${error.message}`, 'danger');
+                    }
+                }
 
-                async function scrapeJobs() {{
+                async function scrapeJobs() {
                     const limitInput = document.getElementById('messageLimit');
                     const limit = limitInput.value;
                     const status = document.getElementById('scrapeStatus');
@@ -297,79 +239,105 @@ async def root(
                     buttonText.textContent = 'Scraping...';
                     spinner.style.display = 'inline-block';
                     
-                    try {{
-                        const response = await fetch('/jobs/scrape?limit=' + limit, {{
+                    try {
+                        const response = await fetch('/jobs/scrape?limit=' + limit, {
                             method: 'POST'
-                        }});
+                        });
                         
-                        const result = await response.json();
+                        const accepted = await response.json();
                         
-                        if (!response.ok) {{
-                            throw new Error(result.detail || 'Scraping failed');
-                        }}
+                        if (!response.ok) {
+                            throw new Error(accepted.detail || 'Scraping failed');
+                        }
+                        
+                        status.textContent = 'Scraping in progress...';
+                        const result = await waitForScraping(accepted.task_id);
+                        
+                        if (result.status === 'error') {
+                            throw new Error(result.message || 'Scraping failed');
+                        }
                         
                         showAlert(result.message, result.status === 'success' ? 'success' : 'warning');
                         status.textContent = 'Scraping completed! Refreshing page...';
                         
                         // Refresh the page after a short delay
                         setTimeout(() => window.location.reload(), 2000);
-                    }} catch (error) {{
-                        showAlert(`Error during scraping: ${{error.message}}`, 'danger');
+                    } catch (error) {
+                        showAlert(`Error during scraping: ${error.message}`, 'danger');
                         status.textContent = 'Error during scraping';
                         button.disabled = false;
                         buttonText.textContent = 'Start Scraping';
                         spinner.style.display = 'none';
-                    }}
-                }}
-
-                async function addChannel() {{
+                    }
+                }
+
+                async function waitForScraping(taskId) {
+                    // Give up polling after 15 minutes
+                    const deadline = Date.now() + 15 * 60 * 1000;
+                    while (Date.now() < deadline) {
+                        await new Promise(resolve => setTimeout(resolve, 2000));
+                        const response = await fetch(`/jobs/scrape/${taskId}`);
+                        const task = await response.json();
+                        
+                        if (!response.ok) {
+                            throw new Error(task.detail || 'Failed to get scraping status');
+                        }
+                        if (task.status !== 'pending' && task.status !== 'running') {
+                            return task;
+                        }
+                    }
+                    throw new Error('Timed out waiting for scraping to finish');
+                }
+
+                async function addChannel() {
                     const channelInput = document.getElementById('newChannel');
                     const channel = channelInput.value.trim();
-                    if (!channel) {{
+                    if (!channel) {
                         showAlert('Please enter a channel name', 'warning');
                         return;
-                    }}
+                    }
 
-                    try {{
-                        const response = await fetch('/channels/add', {{
+                    try {
+                        const response = await fetch('/channels/add', {
                             method: 'POST',
-                            headers: {{'Content-Type': 'application/json'}},
-                            body: JSON.stringify({{ channel_name: channel }})
-                        }});
+                            headers: {'Content-Type': 'application/json'},
+                            body: JSON.stringify({ channel_name: channel })
+                        });
                         
                         if (!response.ok) throw new Error('Failed to add channel');
                         
                         const result = await response.json();
                         showAlert('Channel added successfully', 'success');
                         window.location.reload();
-                    }} catch (error) {{
-                        showAlert(`Error adding channel: ${{error.message}}`, 'danger');
-                    }}
-                }}
-
-                async function toggleChannel(id) {{
-                    try {{
-                        const response = await fetch('/channels/toggle/' + id, {{
+                    } catch (error) {
+                        showAlert(`Error adding channel: ${error.message}`, 'danger');
+                    }
+                }
+
+                async function toggleChannel(id) {
+                    try {
+                        const response = await fetch('/channels/toggle/' + id, {
                             method: 'POST'
-                        }});
+                        });
                         
                         if (!response.ok) throw new Error('Failed to toggle channel');
                         
                         const result = await response.json();
-                        showAlert(`Channel ${{result.is_active ? 'activated' : 'deactivated'}} successfully`, 'success');
+                        showAlert(`Channel ${result.is_active ? 'activated' : 'deactivated'} successfully`, 'success');
                         window.location.reload();
-                    }} catch (error) {{
-                        showAlert(`Error toggling channel: ${{error.message}}`, 'danger');
-                    }}
-                }}
+                    } catch (error) {
+                        showAlert(`Error toggling channel: ${error.message}`, 'danger');
+                    }
+                }
             </script>
         </head>
         <body class="container py-5">
             <header class="mb-5">
                 <h1 class="mb-4">Job Scraper Dashboard</h1>
                 
-                {status_indicators}
-                {''.join(status_alerts)}
+                """
+
+_DASHBOARD_CHANNELS_HEADER = """
                 
                 <!-- Channel Management Section -->
                 <div class="card mb-4">
@@ -388,17 +356,9 @@ async def root(
                             <div class="col-md-6">
                                 <h6>Active Channels</h6>
                                 <div class="list-group">
-                                    {''.join(f'''
-                                    <div class="list-group-item d-flex justify-content-between align-items-center">
-                                        {channel.channel_name}
-                                        <button 
-                                            class="btn btn-sm {'btn-success' if channel.is_active else 'btn-secondary'}"
-                                            onclick="toggleChannel({channel.id})"
-                                        >
-                                            {'Active' if channel.is_active else 'Inactive'}
-                                        </button>
-                                    </div>
-                                    ''' for channel in channels)}
+                                    """
+
+_DASHBOARD_CONTROLS = """
                                 </div>
                             </div>
                         </div>
@@ -434,6 +394,173 @@ async def root(
                     <a href="/jobs/stats" class="btn btn-outline-info">Job Statistics</a>
                 </div>
                 
+"""
+
+
+async def _check_telegram_client():
+    """Return (status, error) for the Telegram client in this worker"""
+    if telegram_client is None:
+        return "disconnected", None
+    try:
+        is_authorized = await telegram_client.is_authorized()
+    except Exception as e:
+        return "error", str(e)
+    return ("connected" if is_authorized else "unauthorized"), None
+
+
+async def _telegram_status(db: AsyncSession):
+    """Return (status, error) for Telegram as seen by the lock holder.
+
+    Other workers read the status the holder last reported, and treat a
+    report older than TELEGRAM_STATUS_MAX_AGE as no holder at all.
+    """
+    if job_monitor_lock is not None:
+        return await _check_telegram_client()
+
+    reported = await db.get(ServiceStatus, "telegram")
+    if reported is None or reported.updated_at < datetime.utcnow() - timedelta(
+        seconds=TELEGRAM_STATUS_MAX_AGE
+    ):
+        return "disconnected", None
+    return reported.status, reported.error
+
+
+async def _report_telegram_status():
+    """Share this worker's Telegram status with the other workers"""
+    status, error = await _check_telegram_client()
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            insert(ServiceStatus)
+            .values(
+                name="telegram",
+                status=status,
+                error=error,
+                updated_at=datetime.utcnow(),
+            )
+            .on_conflict_do_update(
+                index_elements=["name"],
+                set_={
+                    "status": status,
+                    "error": error,
+                    "updated_at": datetime.utcnow(),
+                },
+            )
+        )
+        await db.commit()
+
+
+@app.get("/", response_class=HTMLResponse)
+async def root(
+    page: int = Query(1, ge=1),
+    per_page: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+):
+    """Dashboard page with job cards and controls"""
+    telegram_status, telegram_error = await _telegram_status(db)
+
+    # Get service status
+    service_status = {
+        "telegram": {"status": telegram_status, "error": telegram_error},
+        "database": {"status": "connected", "error": None},
+    }
+
+    try:
+        await db.execute(text("SELECT 1"))
+    except Exception as e:
+        service_status["database"]["status"] = "error"
+        service_status["database"]["error"] = str(e)
+
+    # Add status alert HTML
+    status_alerts = []
+    if service_status["telegram"]["status"] != "connected":
+        alert_type = (
+            "warning"
+            if service_status["telegram"]["status"] == "unauthorized"
+            else "danger"
+        )
+        status_alerts.append(
+            f"""
+        <div class="alert alert-{alert_type} alert-dismissible fade show" role="alert">
+            <strong>Telegram Status:</strong> {service_status["telegram"]["status"]}
+            {f'<br><small>{service_status["telegram"]["error"]}</small>' if service_status["telegram"]["error"] else ''}
+            <button type="button" class="btn-close" data-bs-dismiss="alert" aria-label="Close"></button>
+        </div>
+        """
+        )
+
+    if service_status["database"]["status"] != "connected":
+        status_alerts.append(
+            f"""
+        <div class="alert alert-danger alert-dismissible fade show" role="alert">
+            <strong>Database Status:</strong> {service_status["database"]["status"]}
+            {f'<br><small>{service_status["database"]["error"]}</small>' if service_status["database"]["error"] else ''}
+            <button type="button" class="btn-close" data-bs-dismiss="alert" aria-label="Close"></button>
+        </div>
+        """
+        )
+
+    # Add status indicators to the header
+    status_indicators = f"""
+    <div class="d-flex gap-2 align-items-center mb-3">
+        <div class="d-flex align-items-center">
+            <span class="badge rounded-pill bg-{'success' if service_status['telegram']['status'] == 'connected' else 'warning' if service_status['telegram']['status'] == 'unauthorized' else 'danger'} me-2">
+                Telegram: {service_status["telegram"]["status"]}
+            </span>
+            <span class="badge rounded-pill bg-{'success' if service_status['database']['status'] == 'connected' else 'danger'} me-2">
+                Database: {service_status["database"]["status"]}
+            </span>
+        </div>
+    </div>
+    """
+
+    # Get jobs with pagination
+    offset = (page - 1) * per_page
+    total_jobs = await db.scalar(select(func.count()).select_from(Job))
+
+    total_pages = (total_jobs + per_page - 1) // per_page
+    jobs = (
+        await db.scalars(
+            select(Job)
+            .order_by(desc(Job.telegram_message_date))
+            .offset(offset)
+            .limit(per_page)
+        )
+    ).all()
+
+    # Get channels
+    channels = (
+        await db.scalars(select(TelegramChannel).order_by(TelegramChannel.channel_name))
+    ).all()
+    logger.debug(
+        "Dashboard page %s/%s: %s of %s jobs, %s channels",
+        page,
+        total_pages,
+        len(jobs),
+        total_jobs,
+        len(channels),
+    )
+
+    # Assemble the whole page in one list and join it once at the end
+    parts = [_DASHBOARD_HEAD, status_indicators]
+    parts.extend(status_alerts)
+    parts.append(_DASHBOARD_CHANNELS_HEADER)
+    for channel in channels:
+        parts.append(
+            f"""
+                                    <div class="list-group-item d-flex justify-content-between align-items-center">
+                                        {channel.channel_name}
+                                        <button 
+                                            class="btn btn-sm {'btn-success' if channel.is_active else 'btn-secondary'}"
+                                            onclick="toggleChannel({channel.id})"
+                                        >
+                                            {'Active' if channel.is_active else 'Inactive'}
+                                        </button>
+                                    </div>
+                                    """
+        )
+    parts.append(_DASHBOARD_CONTROLS)
+    parts.append(
+        f"""
                 <div class="d-flex justify-content-between align-items-center">
                     <p class="mb-0">Total Jobs: {total_jobs}</p>
                     <div class="d-flex gap-2">
@@ -456,7 +583,57 @@ async def root(
             </header>
             
             <main>
-                {''.join(job_cards)}
+                """
+    )
+
+    for job in jobs:
+        telegram_link = job.url
+        job_date = job.telegram_message_date.strftime("%Y-%m-%d %H:%M:%S")
+
+        parts.append(
+            f"""
+            <div class="card mb-4" id="job-{job.job_id}">
+                <div class="card-header d-flex justify-content-between align-items-center">
+                    <h5 class="card-title mb-0">{job.title}</h5>
+                    <div class="d-flex gap-2 align-items-center">
+                        <span class="badge bg-primary">{job.telegram_channel_name}</span>
+                        <button 
+                            onclick="deleteJob('{job.job_id}')" 
+                            class="btn btn-sm btn-outline-danger"
+                            title="Delete job"
+                        >
+                            <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" fill="currentColor" class="bi bi-trash" viewBox="0 0 16 16">
+                                <path d="M5.5 5.5A.5.5 0 0 1 6 6v6a.5.5 0 0 1-1 0V6a.5.5 0 0 1 .5-.5m2.5 0a.5.5 0 0 1 .5.5v6a.5.5 0 0 1-1 0V6a.5.5 0 0 1 .5-.5m3 .5a.5.5 0 0 0-1 0v6a.5.5 0 0 0 1 0z"/>
+                                <path d="M14.5 3a1 1 0 0 1-1 1H13v9a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V4h-.5a1 1 0 0 1-1-1V2a1 1 0 0 1 1-1H6a1 1 0 0 1 1-1h2a1 1 0 0 1 1 1h3.5a1 1 0 0 1 1 1zM4.118 4 4 4.059V13a1 1 0 0 0 1 1h6a1 1 0 0 0 1-1V4.059L11.882 4zM2.5 3h11V2h-11z"/>
+                            </svg>
+                        </button>
+                    </div>
+                </div>
+                <div class="card-body">
+                    <div class="mb-3" style="white-space: pre-wrap;">{job.telegram_raw_text}</div>
+                    <div class="d-flex justify-content-between align-items-center">
+                        <div>
+                            <small class="text-muted">Posted: {job_date}</small>
+                            {f'<br><small class="text-muted">Views: {job.telegram_views}</small>' if job.telegram_views else ''}
+                            {f'<br><small class="text-muted">Forwards: {job.telegram_forwards}</small>' if job.telegram_forwards else ''}
+                        </div>
+                        <a href="{telegram_link}" target="_blank" class="btn btn-sm btn-outline-primary">
+                            View on Telegram
+                        </a>
+                    </div>
+                </div>
+                <div class="card-footer">
+                    <div class="d-flex flex-wrap gap-2">
+                        {'<span class="badge bg-success">Remote</span>' if job.remote else ''}
+                        {' '.join(f'<span class="badge bg-info">{cat}</span>' for cat in (job.categories or []))}
+                    </div>
+                </div>
+            </div>
+            """
+        )
+
+    parts.append(
+        f"""
             </main>
             
             <nav aria-label="Page navigation" class="my-4">
@@ -464,7 +641,14 @@ async def root(
                     <li class="page-item {'' if page > 1 else 'disabled'}">
                         <a class="page-link" href="/?page={page-1}" tabindex="-1">Previous</a>
                     </li>
-                    {''.join(page_links)}
+                    """
+    )
+    for p in range(max(1, page - 2), min(total_pages + 1, page + 3)):
+        parts.append(
+            f'<li class="page-item {"active" if p == page else ""}"><a class="page-link" href="/?page={p}">{p}</a></li>'
+        )
+    parts.append(
+        f"""
                     <li class="page-item {'' if page < total_pages else 'disabled'}">
                         <a class="page-link" href="/?page={page+1}">Next</a>
                     </li>
@@ -477,61 +661,49 @@ async def root(
         </body>
     </html>
     """
+    )
+
+    return "".join(parts)
 
 
-@app.get("/jobs/latest", response_model=List[JobResponse])
+@app.get(
+    "/jobs/latest",
+    response_model=None,
+    responses={200: {"model": List[JobResponse]}},
+)
 async def get_latest_jobs(
     limit: int = Query(10, description="Number of jobs to return"),
     skip: int = Query(0, description="Number of jobs to skip"),
     channel: str = Query(None, description="Filter by Telegram channel"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Get the latest scraped jobs"""
-    query = db.query(Job).order_by(desc(Job.telegram_message_date))
+    stmt = select(*JOB_RESPONSE_COLUMNS).order_by(desc(Job.telegram_message_date))
 
     if channel:
-        query = query.filter(Job.telegram_channel_name == channel)
-
-    jobs = query.offset(skip).limit(limit).all()
-
-    return [
-        JobResponse(
-            id=job.job_id,
-            title=job.title,
-            company=job.company_name,
-            location=job.location,
-            description=job.telegram_raw_text,  # Use raw text instead of processed description
-            url=job.url,
-            remote=job.remote,
-            salary_min=job.salary_min,
-            salary_max=job.salary_max,
-            currency=job.currency,
-            categories=job.categories,
-            telegram_channel=job.telegram_channel_name,
-            telegram_message_date=job.telegram_message_date,
-            telegram_views=job.telegram_views,
-            telegram_forwards=job.telegram_forwards,
-        )
-        for job in jobs
-    ]
+        stmt = stmt.where(Job.telegram_channel_name == channel)
+
+    rows = (await db.execute(stmt.offset(skip).limit(limit))).all()
+
+    return [_job_response(row) for row in rows]
 
 
 @app.get("/jobs/channels/stats")
-async def get_channel_stats(db: Session = Depends(get_db)):
+async def get_channel_stats(db: AsyncSession = Depends(get_db)):
     """Get statistics for each Telegram channel"""
     stats = []
-    channels = db.query(TelegramChannel).all()
+    channels = (await db.scalars(select(TelegramChannel))).all()
     for channel in channels:
-        count = (
-            db.query(Job)
-            .filter(Job.telegram_channel_name == channel.channel_name)
-            .count()
+        count = await db.scalar(
+            select(func.count())
+            .select_from(Job)
+            .where(Job.telegram_channel_name == channel.channel_name)
         )
-        latest = (
-            db.query(Job)
-            .filter(Job.telegram_channel_name == channel.channel_name)
+        latest = await db.scalar(
+            select(Job)
+            .where(Job.telegram_channel_name == channel.channel_name)
             .order_by(desc(Job.telegram_message_date))
-            .first()
+            .limit(1)
         )
         stats.append(
             {
@@ -545,113 +717,191 @@ async def get_channel_stats(db: Session = Depends(get_db)):
     return stats
 
 
-@app.get("/jobs/search", response_model=List[JobResponse])
+def _encode_cursor(message_date: datetime, row_id: int) -> str:
+    """Encode a /jobs/search keyset position as an opaque token"""
+    payload = json.dumps([message_date.isoformat(), row_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str):
+    """Decode a token from _encode_cursor into (message_date, row_id)"""
+    try:
+        message_date, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(message_date), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@app.get(
+    "/jobs/search",
+    response_model=None,
+    responses={200: {"model": List[JobResponse]}},
+)
 async def search_jobs(
-    query: str = Query(None, description="Search in title or description"),
+    response: Response,
+    query: str = Query(None, description="Search in title, company or description"),
     channel: str = Query(None, description="Filter by Telegram channel"),
     remote: bool = Query(None, description="Filter by remote jobs"),
     categories: List[str] = Query(None, description="Filter by job categories"),
+    cursor: Optional[str] = Query(
+        None, description="X-Next-Cursor value from the previous page"
+    ),
     skip: int = Query(0, description="Number of records to skip"),
-    limit: int = Query(20, description="Number of records to return"),
-    db: Session = Depends(get_db),
+    limit: int = Query(20, ge=1, description="Number of records to return"),
+    db: AsyncSession = Depends(get_db),
 ):
-    """Search jobs with various filters"""
-    jobs_query = db.query(Job)
+    """Search jobs with various filters
 
+    Deep pages should follow the X-Next-Cursor header rather than skip: a
+    cursor seeks straight to the next page instead of scanning past it.
+    """
+    filters = []
     if query:
-        jobs_query = jobs_query.filter(
+        filters.append(
             or_(
-                Job.title.ilike(f"%{query}%"), Job.telegram_raw_text.ilike(f"%{query}%")
+                Job.search_vector.op("@@")(func.websearch_to_tsquery("simple", query)),
+                Job.title.ilike(f"%{query}%"),
+                Job.company_name.ilike(f"%{query}%"),
             )
         )
 
     if channel:
-        jobs_query = jobs_query.filter(Job.telegram_channel_name == channel)
+        filters.append(Job.telegram_channel_name == channel)
 
     if remote is not None:
-        jobs_query = jobs_query.filter(Job.remote == remote)
+        filters.append(Job.remote == remote)
 
     if categories:
-        jobs_query = jobs_query.filter(Job.categories.overlap(categories))
+        filters.append(Job.categories.has_any(array(categories)))
 
-    total = jobs_query.count()
-    jobs = (
-        jobs_query.order_by(desc(Job.telegram_message_date))
-        .offset(skip)
-        .limit(limit)
-        .all()
+    page_query = (
+        select(*JOB_RESPONSE_COLUMNS, Job.id.label("row_id"))
+        .where(*filters)
+        .order_by(desc(Job.telegram_message_date), desc(Job.id))
     )
+    if cursor:
+        page_query = page_query.where(
+            tuple_(Job.telegram_message_date, Job.id) < _decode_cursor(cursor)
+        )
+    else:
+        page_query = page_query.offset(skip)
+
+    rows = (await db.execute(page_query.limit(limit))).all()
 
-    return [
-        JobResponse(
-            id=job.job_id,
-            title=job.title,
-            company=job.company_name,
-            location=job.location,
-            description=job.telegram_raw_text,
-            url=job.url,
-            remote=job.remote,
-            salary_min=job.salary_min,
-            salary_max=job.salary_max,
-            currency=job.currency,
-            categories=job.categories,
-            telegram_channel=job.telegram_channel_name,
-            telegram_message_date=job.telegram_message_date,
-            telegram_views=job.telegram_views,
-            telegram_forwards=job.telegram_forwards,
+    # After a cursor the count would only cover the remaining rows, so cursor
+    # pages don't report it and the page query can stop after limit rows
+    if not cursor:
+        total = await db.scalar(select(func.count(Job.id)).where(*filters))
+        response.headers["X-Total-Count"] = str(total)
+
+    if rows and len(rows) == limit and rows[-1].telegram_message_date is not None:
+        response.headers["X-Next-Cursor"] = _encode_cursor(
+            rows[-1].telegram_message_date, rows[-1].row_id
         )
-        for job in jobs
-    ]
+
+    return [_job_response(row) for row in rows]
 
 
 @app.on_event("startup")
 async def startup_event():
-    global gemini_model, telegram_client
+    global gemini_model, job_monitor_runner
+    # Thread pool for blocking calls made through asyncio.to_thread
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2))
+    )
+    # Bring the schema up to date before serving; safe to run in every worker
+    await asyncio.to_thread(init_db)
+
     try:
         gemini_model = GeminiModel()
-        print("Successfully initialized Gemini model")
+        logger.info("Successfully initialized Gemini model")
     except Exception as e:
-        print(f"Failed to load Gemini model: {e}")
+        logger.error("Failed to load Gemini model: %s", e)
+
+    # Every worker competes for the job monitor lock for as long as it runs
+    job_monitor_runner = asyncio.create_task(_hold_job_monitor())
+
+
+async def _start_job_monitor():
+    """Start Telegram, job monitoring and the manual scrape runner here"""
+    global telegram_client, scrape_task_runner
+    # Manual scrapes queued by any worker run here
+    scrape_task_runner = asyncio.create_task(_process_scrape_tasks())
 
     try:
-        telegram_client = TelegramJobClient()
+        telegram_client = TelegramJobClient.get()
         auth_success = await telegram_client.start()
         if auth_success:
-            print("Successfully initialized and authenticated Telegram client")
+            logger.info("Successfully initialized and authenticated Telegram client")
             # Start initial job scraping
-            asyncio.create_task(telegram_client.start_job_monitoring())
+            telegram_client.start_monitoring()
         else:
-            print("Failed to authenticate Telegram client")
+            logger.error("Failed to authenticate Telegram client")
     except Exception as e:
-        print(f"Failed to initialize Telegram client: {e}")
+        logger.error("Failed to initialize Telegram client: %s", e)
+
+
+async def _hold_job_monitor():
+    """Take the job monitor lock whenever it is free.
+
+    The Telethon session file is not safe to share, so under several workers
+    only the lock holder connects to Telegram. The others keep retrying, so
+    the monitor moves to another worker when the holder exits, e.g. on a
+    reload, or when the first attempt hit a database error. Once holding the
+    lock, this reports the Telegram status for the other workers.
+    """
+    global job_monitor_lock
+    while True:
+        try:
+            if job_monitor_lock is None:
+                job_monitor_lock = await asyncio.to_thread(
+                    try_acquire_job_monitor_lock
+                )
+                if job_monitor_lock is not None:
+                    await _start_job_monitor()
+            if job_monitor_lock is not None:
+                await _report_telegram_status()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Job monitor lock or status update failed")
+        await asyncio.sleep(JOB_MONITOR_LOCK_RETRY_INTERVAL)
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    if job_monitor_runner is not None:
+        job_monitor_runner.cancel()
+    if scrape_task_runner is not None:
+        scrape_task_runner.cancel()
     if telegram_client:
         await telegram_client.stop()
+    if job_monitor_lock is not None:
+        release_job_monitor_lock(job_monitor_lock)
 
 
 @app.get("/health")
-async def health_check():
+async def health_check(db: AsyncSession = Depends(get_db)):
     """Check the health of the service"""
+    telegram_status, _ = await _telegram_status(db)
     return {
         "status": "healthy",
         "timestamp": datetime.utcnow().isoformat(),
         "services": {
             "ai": gemini_model is not None,
-            "telegram": telegram_client is not None,
+            # A client is running in whichever worker holds the monitor lock
+            "telegram": telegram_status != "disconnected",
         },
     }
 
 
 @app.post("/ai/analyze")
-async def analyze_job(job_id: str, db: Session = Depends(get_db)):
+async def analyze_job(job_id: str, db: AsyncSession = Depends(get_db)):
     """Analyze a job posting using AI"""
     if gemini_model is None:
         raise HTTPException(status_code=503, detail="AI model not available")
 
-    job = db.query(Job).filter(Job.job_id == job_id).first()
+    job = await db.scalar(select(Job).where(Job.job_id == job_id))
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -670,115 +920,147 @@ async def analyze_job(job_id: str, db: Session = Depends(get_db)):
         5. Red flags (if any)
         """
 
-        analysis = gemini_model.generate_text(prompt, max_length=1000)
+        # The Gemini SDK call blocks, so keep it off the event loop
+        async with gemini_semaphore:
+            analysis = await asyncio.to_thread(
+                gemini_model.generate_text, prompt, max_length=1000
+            )
         return {"analysis": analysis}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/jobs/stats")
-async def get_job_stats(db: Session = Depends(get_db)):
+async def get_job_stats(response: Response, db: AsyncSession = Depends(get_db)):
     """Get statistics about stored jobs"""
-    try:
-        total_jobs = db.query(Job).count()
-        remote_jobs = db.query(Job).filter(Job.remote == True).count()
-        with_salary = db.query(Job).filter(Job.salary_min.isnot(None)).count()
+    response.headers["Cache-Control"] = f"private, max-age={RESPONSE_CACHE_TTL:.0f}"
+    cached = _get_cached("job_stats")
+    if cached is not None:
+        return cached
 
-        # Get category distribution
-        category_stats = {}
-        jobs_with_categories = db.query(Job).filter(Job.categories.isnot(None)).all()
-        for job in jobs_with_categories:
-            for category in job.categories or []:
-                category_stats[category] = category_stats.get(category, 0) + 1
+    try:
+        total_jobs, remote_jobs, with_salary = (
+            await db.execute(
+                select(
+                    func.count(),
+                    func.count().filter(Job.remote == True),
+                    func.count().filter(Job.salary_min.isnot(None)),
+                ).select_from(Job)
+            )
+        ).one()
+
+        # Get category distribution, counted by the database
+        category = func.jsonb_array_elements_text(Job.categories).label("category")
+        category_rows = await db.execute(
+            select(category, func.count())
+            .where(func.jsonb_typeof(Job.categories) == "array")
+            .group_by("category")
+        )
+        category_stats = dict(category_rows.all())
 
-        return {
-            "total_jobs": total_jobs,
-            "remote_jobs": remote_jobs,
-            "jobs_with_salary": with_salary,
-            "category_distribution": category_stats,
-            "last_update": datetime.utcnow().isoformat(),
-        }
+        return _set_cached(
+            "job_stats",
+            {
+                "total_jobs": total_jobs,
+                "remote_jobs": remote_jobs,
+                "jobs_with_salary": with_salary,
+                "category_distribution": category_stats,
+                "last_update": datetime.utcnow().isoformat(),
+            },
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/jobs/scrape")
-async def trigger_scraping(
-    limit: int = Query(50, ge=1, le=1000), db: Session = Depends(get_db)
-):
-    """Manually trigger job scraping from Telegram channels with custom limit"""
-    print("\n=== Starting Manual Scraping Process ===")
-    print(f"Requested message limit per channel: {limit}")
+async def _finish_scrape_task(task_id: str, status: str, message: str, details=None):
+    """Record the outcome of a manual scrape"""
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(ScrapeTask)
+            .where(ScrapeTask.task_id == task_id)
+            .values(
+                status=status,
+                message=message,
+                details=details,
+                finished_at=datetime.utcnow(),
+            )
+        )
+        await db.commit()
 
-    # Check Telegram client status
-    if telegram_client is None:
-        error_msg = "Telegram client not available"
-        print(f"Error: {error_msg}")
-        raise HTTPException(status_code=503, detail=error_msg)
 
+async def _run_scraping(task_id: str, limit: int):
+    """Scrape every active channel and record the outcome under task_id"""
+    logger.info("Starting manual scrape %s (limit %s per channel)", task_id, limit)
+    status, message, details = "error", None, None
+
+    db = AsyncSessionLocal()
     try:
-        # Check if client is authorized
-        is_authorized = await telegram_client.client.is_user_authorized()
+        # Check Telegram client status
+        if telegram_client is None:
+            message = "Telegram client not available"
+            logger.warning(message)
+            return
+
+        try:
+            # Check if client is authorized
+            is_authorized = await telegram_client.is_authorized()
+        except Exception as e:
+            message = f"Failed to check Telegram authorization: {str(e)}"
+            logger.warning(message)
+            return
         if not is_authorized:
-            error_msg = (
-                "Telegram client not authorized. Please check authentication status."
-            )
-            print(f"Error: {error_msg}")
-            raise HTTPException(status_code=503, detail=error_msg)
+            message = "Telegram client not authorized. Please check authentication status."
+            logger.warning(message)
+            return
 
         # Check if client is connected
         if not telegram_client.client.is_connected():
-            error_msg = "Telegram client not connected. Attempting to reconnect..."
-            print(error_msg)
+            logger.info("Telegram client not connected. Attempting to reconnect...")
             try:
                 await telegram_client.client.connect()
             except Exception as e:
-                error_msg = f"Failed to reconnect to Telegram: {str(e)}"
-                print(f"Error: {error_msg}")
-                raise HTTPException(status_code=503, detail=error_msg)
+                message = f"Failed to reconnect to Telegram: {str(e)}"
+                logger.warning(message)
+                return
 
         # Get active channels from database
         active_channels = (
-            db.query(TelegramChannel).filter(TelegramChannel.is_active == True).all()
-        )
-        print(f"Found {len(active_channels)} active channels")
+            await db.scalars(
+                select(TelegramChannel).where(TelegramChannel.is_active == True)
+            )
+        ).all()
+        logger.info("Found %s active channels", len(active_channels))
 
         if not active_channels:
-            print("Warning: No active channels configured")
-            return {
-                "status": "warning",
-                "message": "No active channels configured. Please add and activate channels first.",
-            }
-
-        # Get initial job count
-        initial_count = db.query(Job).count()
-        print(f"Initial job count: {initial_count}")
+            logger.warning("No active channels configured")
+            status = "warning"
+            message = "No active channels configured. Please add and activate channels first."
+            return
+
+        # The client scrapes the channels concurrently and stamps
+        # last_scraped on the ones that succeeded
+        results = await telegram_client._scrape_channels(
+            [channel.channel_name for channel in active_channels], limit
+        )
 
-        # Scrape each active channel
         scraped_channels = 0
+        new_jobs = 0
         errors = []
-        for channel in active_channels:
-            try:
-                print(f"\nScraping channel: {channel.channel_name}")
-                await telegram_client._scrape_recent_jobs(channel.channel_name, limit)
-                channel.last_scraped = datetime.utcnow()
-                db.commit()
-                scraped_channels += 1
-                print(f"Successfully scraped channel: {channel.channel_name}")
-            except Exception as e:
-                error_msg = f"Error scraping channel {channel.channel_name}: {str(e)}"
-                print(error_msg)
+        for channel_name, result in results.items():
+            if isinstance(result, Exception):
+                error_msg = f"Error scraping channel {channel_name}: {str(result)}"
+                logger.warning(error_msg)
                 errors.append(error_msg)
-                continue
+            else:
+                scraped_channels += 1
+                new_jobs += result
+        response_cache.clear()
 
-        # Get final job count
-        final_count = db.query(Job).count()
-        new_jobs = final_count - initial_count
-        print(f"\nScraping complete:")
-        print(f"- Channels scraped: {scraped_channels}")
-        print(f"- Initial job count: {initial_count}")
-        print(f"- Final job count: {final_count}")
-        print(f"- New jobs added: {new_jobs}")
+        logger.info(
+            "Scraping complete: %s channels scraped, %s new jobs",
+            scraped_channels,
+            new_jobs,
+        )
 
         # Prepare response message
         if errors:
@@ -788,89 +1070,252 @@ async def trigger_scraping(
             status = "success"
             message = f"Successfully scraped {scraped_channels} channels. Added {new_jobs} new jobs."
 
-        return {
-            "status": status,
-            "message": message,
-            "details": {
-                "channels_scraped": scraped_channels,
-                "new_jobs": new_jobs,
-                "errors": errors,
-            },
+        details = {
+            "channels_scraped": scraped_channels,
+            "new_jobs": new_jobs,
+            "errors": errors,
         }
     except Exception as e:
-        error_msg = f"Error during scraping process: {str(e)}"
-        print(error_msg)
-        raise HTTPException(status_code=500, detail=error_msg)
+        status = "error"
+        message = f"Error during scraping process: {str(e)}"
+        logger.exception("Error during scraping process")
     finally:
-        print("=== Manual Scraping Process Complete ===\n")
+        await db.close()
+        await _finish_scrape_task(task_id, status, message, details)
 
 
-@app.get("/jobs/channels")
-async def list_channels(db: Session = Depends(get_db)):
-    """List all configured job channels"""
-    if telegram_client is None:
-        raise HTTPException(status_code=503, detail="Telegram client not available")
+async def _process_scrape_tasks():
+    """Run queued manual scrapes one at a time.
 
-    channels = db.query(TelegramChannel).all()
+    Only the worker holding the job monitor lock runs this, since it is the
+    one connected to Telegram; the other workers just queue tasks.
+    """
+    try:
+        # Scrapes left running by a previous lock holder will never finish
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(ScrapeTask)
+                .where(ScrapeTask.status == "running")
+                .values(
+                    status="error",
+                    message="Scraping was interrupted by a restart",
+                    finished_at=datetime.utcnow(),
+                )
+            )
+            await db.commit()
+    except Exception:
+        logger.exception("Failed to clean up interrupted scrapes")
+
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                oldest_pending = (
+                    select(ScrapeTask.task_id)
+                    .where(ScrapeTask.status == "pending")
+                    .order_by(ScrapeTask.created_at)
+                    .limit(1)
+                    .scalar_subquery()
+                )
+                claimed = (
+                    await db.execute(
+                        update(ScrapeTask)
+                        .where(ScrapeTask.task_id == oldest_pending)
+                        .where(ScrapeTask.status == "pending")
+                        .values(status="running")
+                        .returning(ScrapeTask.task_id, ScrapeTask.limit)
+                    )
+                ).first()
+                await db.commit()
+
+            if claimed is None:
+                await asyncio.sleep(SCRAPE_TASK_POLL_INTERVAL)
+                continue
+            task_id, limit = claimed
+            await _run_scraping(task_id, limit)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Error processing queued scrapes")
+            await asyncio.sleep(SCRAPE_TASK_POLL_INTERVAL)
+
+
+async def _fail_stale_scrape_tasks(db: AsyncSession):
+    """Fail tasks no worker picked up within SCRAPE_TASK_PENDING_TIMEOUT"""
+    await db.execute(
+        update(ScrapeTask)
+        .where(ScrapeTask.status == "pending")
+        .where(
+            ScrapeTask.created_at
+            < datetime.utcnow() - timedelta(seconds=SCRAPE_TASK_PENDING_TIMEOUT)
+        )
+        .values(
+            status="error",
+            message="No worker picked up the scrape. Is the Telegram client running?",
+            finished_at=datetime.utcnow(),
+        )
+    )
+
+
+def _scrape_task_response(task: ScrapeTask) -> dict:
     return {
-        "channels": [
-            {
-                "id": channel.id,
-                "name": channel.channel_name,
-                "is_active": channel.is_active,
-                "last_scraped": channel.last_scraped,
-            }
-            for channel in channels
-        ],
-        "total": len(channels),
+        "task_id": task.task_id,
+        "status": task.status,
+        "limit": task.limit,
+        "message": task.message,
+        "details": task.details,
+        "created_at": task.created_at,
+        "finished_at": task.finished_at,
+    }
+
+
+@app.post("/jobs/scrape", status_code=202)
+async def trigger_scraping(
+    limit: int = Query(50, ge=1, le=1000), db: AsyncSession = Depends(get_db)
+):
+    """Queue a manual scrape of the Telegram channels with custom limit"""
+    # Serializes concurrent triggers across workers until the commit below
+    await db.execute(
+        text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCRAPE_TASK_LOCK_KEY}
+    )
+
+    # Forget finished tasks once their outcome has had time to be polled
+    await db.execute(
+        delete(ScrapeTask).where(
+            ScrapeTask.finished_at
+            < datetime.utcnow() - timedelta(seconds=SCRAPE_TASK_TTL)
+        )
+    )
+
+    await _fail_stale_scrape_tasks(db)
+
+    # Only one scrape runs at a time; hand back the one already in flight
+    task_id = await db.scalar(
+        select(ScrapeTask.task_id)
+        .where(ScrapeTask.status.in_(("pending", "running")))
+        .limit(1)
+    )
+    if task_id is not None:
+        await db.commit()
+        return {
+            "status": "accepted",
+            "task_id": task_id,
+            "message": "Scraping is already in progress",
+        }
+
+    task_id = uuid.uuid4().hex
+    db.add(ScrapeTask(task_id=task_id, status="pending", limit=limit))
+    await db.commit()
+
+    return {
+        "status": "accepted",
+        "task_id": task_id,
+        "message": "Scraping started",
     }
 
 
+@app.get("/jobs/scrape/{task_id}")
+async def get_scraping_status(task_id: str, db: AsyncSession = Depends(get_db)):
+    """Get the status of a queued manual scrape"""
+    await _fail_stale_scrape_tasks(db)
+    await db.commit()
+
+    task = await db.get(ScrapeTask, task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Scrape task not found")
+    return _scrape_task_response(task)
+
+
+@app.get("/jobs/channels")
+async def list_channels(db: AsyncSession = Depends(get_db)):
+    """List all configured job channels"""
+    cached = _get_cached("channels")
+    if cached is not None:
+        return cached
+
+    channels = (await db.scalars(select(TelegramChannel))).all()
+    return _set_cached(
+        "channels",
+        {
+            "channels": [
+                {
+                    "id": channel.id,
+                    "name": channel.channel_name,
+                    "is_active": channel.is_active,
+                    "last_scraped": channel.last_scraped,
+                }
+                for channel in channels
+            ],
+            "total": len(channels),
+        },
+    )
+
+
 @app.post("/channels/add")
-async def add_channel(channel: dict, db: Session = Depends(get_db)):
+async def add_channel(channel: dict, db: AsyncSession = Depends(get_db)):
     """Add a new Telegram channel"""
     try:
-        new_channel = TelegramChannel(
-            channel_name=channel["channel_name"], is_active=True
+        channel_id = await db.scalar(
+            insert(TelegramChannel)
+            .values(channel_name=channel["channel_name"], is_active=True)
+            .on_conflict_do_nothing(index_elements=["channel_name"])
+            .returning(TelegramChannel.id)
         )
-        db.add(new_channel)
-        db.commit()
-        return {"status": "success", "message": "Channel added successfully"}
+        await db.commit()
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
+    if channel_id is None:
+        raise HTTPException(status_code=409, detail="Channel already exists")
+
+    response_cache.clear()
+    if telegram_client is not None:
+        telegram_client.invalidate_channels()
+    return {"status": "success", "message": "Channel added successfully"}
+
 
 @app.post("/channels/toggle/{channel_id}")
-async def toggle_channel(channel_id: int, db: Session = Depends(get_db)):
+async def toggle_channel(channel_id: int, db: AsyncSession = Depends(get_db)):
     """Toggle channel active status"""
-    channel = db.query(TelegramChannel).filter(TelegramChannel.id == channel_id).first()
+    channel = await db.get(TelegramChannel, channel_id)
     if not channel:
         raise HTTPException(status_code=404, detail="Channel not found")
 
     channel.is_active = not channel.is_active
-    db.commit()
+    await db.commit()
+    response_cache.clear()
+    if telegram_client is not None:
+        telegram_client.invalidate_channels()
     return {"status": "success", "is_active": channel.is_active}
 
 
 @app.delete("/jobs/{job_id}")
-async def delete_job(job_id: str, db: Session = Depends(get_db)):
+async def delete_job(job_id: str, db: AsyncSession = Depends(get_db)):
     """Delete a job posting"""
     try:
-        job = db.query(Job).filter(Job.job_id == job_id).first()
+        job = await db.scalar(select(Job).where(Job.job_id == job_id))
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
 
-        db.delete(job)
-        db.commit()
+        await db.delete(job)
+        await db.commit()
+        response_cache.clear()
         return {"status": "success", "message": "Job deleted successfully"}
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 
 def start_server(host="0.0.0.0", port=8000):
-    uvicorn.run(app, host=host, port=port)
+    # Single process; run several workers through gunicorn.conf.py instead
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        backlog=2048,
+    )
 
 
 if __name__ == "__main__":
@@ -4,10 +4,61 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_model = None
+
+
+def _get_model():
+    """Configure the Gemini client and build the shared model on first use."""
+    global _model
+    if _model is None:
+        genai.configure(api_key=settings.GEMINI_API_KEY)
+        _model = genai.GenerativeModel('gemini-1.5-flash')
+    return _model
+
+
 class GeminiService:
+    # Sampling settings for resume adaptation, shared by every request
+    GENERATION_CONFIG = {
+        "temperature": 0.1,  # Lower temperature for more precise copying
+        "candidate_count": 1,
+        "max_output_tokens": 2048,
+        "top_p": 0.8,
+        "top_k": 40,
+    }
+
+    # Fixed parts of the resume adaptation prompt, around the job description
+    # and the LaTeX template
+    PROMPT_HEADER = """You are a professional resume editor. Your task is to adapt this LaTeX resume for a specific job.
+
+            Job Description:
+            """
+    PROMPT_TEMPLATE_HEADING = """
+
+            Current Resume Template (in LaTeX):
+            """
+    PROMPT_INSTRUCTIONS = """
+
+            Instructions:
+            1. Keep the EXACT same LaTeX preamble (documentclass, packages, etc.) from the template
+            2. Keep the EXACT same document structure and environments
+            3. Only modify the content inside sections to match the job requirements
+            4. Do not change any formatting commands or document settings
+            5. Ensure all LaTeX environments remain properly closed
+            6. Return the COMPLETE LaTeX document
+
+            IMPORTANT:
+            - Copy and use the EXACT same \\\\documentclass line from the template
+            - Copy and use ALL the same \\\\usepackage commands from the template
+            - Keep ALL the same formatting definitions from the template
+            - Maintain the EXACT same document structure
+            - End with \\\\end{document}
+            - Do not add any explanations or markdown formatting
+            - Return ONLY the LaTeX code
+
+            If you cannot generate a valid response, return an error message starting with 'ERROR:'."""
+
     def __init__(self):
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        self.model = _get_model()
 
     def adapt_template_resume(self, template_file, job_description):
         """Adapt LaTeX resume template for a specific job."""
@@ -32,43 +83,18 @@ class GeminiService:
                 raise Exception("Template file is empty")
             
             logger.info("Creating prompt")
-            prompt = f"""You are a professional resume editor. Your task is to adapt this LaTeX resume for a specific job.
-
-            Job Description:
-            {job_description}
-
-            Current Resume Template (in LaTeX):
-            {latex_template}
-
-            Instructions:
-            1. Keep the EXACT same LaTeX preamble (documentclass, packages, etc.) from the template
-            2. Keep the EXACT same document structure and environments
-            3. Only modify the content inside sections to match the job requirements
-            4. Do not change any formatting commands or document settings
-            5. Ensure all LaTeX environments remain properly closed
-            6. Return the COMPLETE LaTeX document
-
-            IMPORTANT:
-            - Copy and use the EXACT same \\\\documentclass line from the template
-            - Copy and use ALL the same \\\\usepackage commands from the template
-            - Keep ALL the same formatting definitions from the template
-            - Maintain the EXACT same document structure
-            - End with \\\\end{{document}}
-            - Do not add any explanations or markdown formatting
-            - Return ONLY the LaTeX code
-
-            If you cannot generate a valid response, return an error message starting with 'ERROR:'."""
+            prompt = "".join((
+                self.PROMPT_HEADER,
+                job_description,
+                self.PROMPT_TEMPLATE_HEADING,
+                latex_template,
+                self.PROMPT_INSTRUCTIONS,
+            ))
 
             logger.info("Calling LLM")
             response = self.model.generate_content(
                 prompt,
-                generation_config={
-                    "temperature": 0.1,  # Lower temperature for more precise copying
-                    "candidate_count": 1,
-                    "max_output_tokens": 2048,
-                    "top_p": 0.8,
-                    "top_k": 40,
-                }
+                generation_config=self.GENERATION_CONFIG
             )
             logger.info("Got response from LLM")
             
@@ -1,36 +1,104 @@
-from telethon import TelegramClient
-from telethon.tl.functions.messages import SearchRequest, GetHistoryRequest
-from telethon.tl.types import InputMessagesFilterEmpty
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from telethon import TelegramClient, events
+from typing import Dict, List, Optional, Tuple, Union
+from datetime import datetime
 from src.api_keys import TELEGRAM_API_ID, TELEGRAM_API_HASH
+from telethon.errors import (
+    ChannelInvalidError,
+    ChannelPrivateError,
+    FloodWaitError,
+    UsernameInvalidError,
+    UsernameNotOccupiedError,
+)
 from src.models.database import Job, TelegramChannel, SessionLocal
+from sqlalchemy import case, func, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert
 import re
 import asyncio
 import os
+import time
+import ahocorasick
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# Field extraction patterns, compiled once for every message
+COMPANY_RE = re.compile(
+    r"(?i)(?:at|@|company:?)\s*([A-Za-z0-9\s]+(?:Inc\.?|LLC|Ltd\.?|Limited|Corp\.?|Corporation)?)"
+)
+LOCATION_RE = re.compile(
+    r"(?i)(?:location:?|based in:?|remote|on-site|hybrid)\s*([A-Za-z0-9\s,]+)"
+)
+SALARY_RE = re.compile(r"(?i)(?:salary:?|compensation:?|pay:?)\s*([A-Za-z0-9\s\$\-\,]+)")
+SALARY_CLEANUP_RE = re.compile(r"[^\d\-\s]")
+NUMBER_RE = re.compile(r"\d+")
+
+
+@lru_cache(maxsize=4096)
+def _extract_fields(text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Find the company, location and salary text in a message
+
+    Channels often repost the same text verbatim, so results are cached by
+    message text. lru_cache is thread-safe, which the parsing threads need.
+    """
+    company_match = COMPANY_RE.search(text)
+    location_match = LOCATION_RE.search(text)
+    salary_match = SALARY_RE.search(text)
+    return (
+        company_match.group(1) if company_match else None,
+        location_match.group(1) if location_match else None,
+        salary_match.group(1) if salary_match else None,
+    )
+
+
+class TokenBucket:
+    """Async token bucket pacing requests to the Telegram API
+
+    After a flood wait the refill rate is halved (down to min_rate); a
+    request that goes through restores the full rate.
+    """
+
+    def __init__(self, rate: float, capacity: int, min_rate: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
 
+    def slow_down(self):
+        self.rate = max(self.min_rate, self.rate / 2)
 
-class TelegramJobClient:
-    def __init__(self):
-        # Use a fixed path in the container for the session file
-        self.session_file = "/app/sessions/telegram_session"
-        # Ensure the sessions directory exists
-        os.makedirs(os.path.dirname(self.session_file), exist_ok=True)
+    def reset(self):
+        self.rate = self.base_rate
 
-        print(f"Initializing Telegram client with session file: {self.session_file}")
-        print(f"Session file exists: {os.path.exists(f'{self.session_file}.session')}")
 
-        self.client = TelegramClient(
-            self.session_file,
-            TELEGRAM_API_ID,
-            TELEGRAM_API_HASH,
-            system_version="4.16.30-vxCUSTOM",
-            device_model="Desktop",
-        )
-        self.db = SessionLocal()
-        self.job_keywords = ["hiring", "job", "position", "role", "vacancy", "opening"]
-        self.tech_categories = {
-            "frontend": [
+class TelegramJobClient:
+    # Words that mark a message as a job post
+    JOB_KEYWORDS = frozenset(
+        {"hiring", "job", "position", "role", "vacancy", "opening"}
+    )
+    # Work-arrangement words recorded as flags while classifying
+    FLAG_KEYWORDS = frozenset({"remote", "on-site", "hybrid"})
+    # Tech keywords per category; categories are reported in this order
+    TECH_CATEGORIES = {
+        "frontend": frozenset(
+            {
                 "react",
                 "vue",
                 "angular",
@@ -39,8 +107,10 @@ class TelegramJobClient:
                 "frontend",
                 "front-end",
                 "web developer",
-            ],
-            "backend": [
+            }
+        ),
+        "backend": frozenset(
+            {
                 "python",
                 "java",
                 "golang",
@@ -49,433 +119,669 @@ class TelegramJobClient:
                 "back-end",
                 "ruby",
                 "php",
-            ],
-            "fullstack": ["full stack", "fullstack", "full-stack", "mern", "mean"],
-            "mobile": ["ios", "android", "react native", "flutter", "mobile developer"],
-            "devops": ["devops", "aws", "kubernetes", "docker", "ci/cd", "sre"],
-            "data": [
+            }
+        ),
+        "fullstack": frozenset(
+            {"full stack", "fullstack", "full-stack", "mern", "mean"}
+        ),
+        "mobile": frozenset(
+            {"ios", "android", "react native", "flutter", "mobile developer"}
+        ),
+        "devops": frozenset({"devops", "aws", "kubernetes", "docker", "ci/cd", "sre"}),
+        "data": frozenset(
+            {
                 "data scientist",
                 "machine learning",
                 "ml",
                 "ai",
                 "data engineer",
                 "big data",
-            ],
-            "blockchain": [
-                "blockchain",
-                "web3",
-                "smart contract",
-                "solidity",
-                "ethereum",
-            ],
-            "security": [
+            }
+        ),
+        "blockchain": frozenset(
+            {"blockchain", "web3", "smart contract", "solidity", "ethereum"}
+        ),
+        "security": frozenset(
+            {
                 "security engineer",
                 "penetration tester",
                 "security analyst",
                 "cybersecurity",
-            ],
-        }
+            }
+        ),
+    }
+    # Keyword automaton shared by all instances, see _keyword_matcher()
+    _keyword_automaton = None
+    # Channels scraped at the same time
+    CHANNEL_CONCURRENCY = 4
+    # Seconds the active channel list is reused before querying it again.
+    # Channels added or toggled through other API workers only show up in
+    # this process once it expires, so keep it short.
+    CHANNELS_CACHE_TTL = 60
+    # Flood waits a channel sits out before it is skipped for this scrape,
+    # and the longest wait (seconds) worth sitting out at all
+    MAX_FLOOD_RETRIES = 3
+    MAX_FLOOD_WAIT = 300
+    # Messages handed to a parsing thread at a time
+    PARSE_PAGE_SIZE = 100
+    # Seconds a resolved channel entity is reused
+    ENTITY_CACHE_TTL = 3600
+    # Seconds between history scrapes while monitoring. Joined channels also
+    # push new posts as events, but channels the account only reads get no
+    # updates and depend on this scrape.
+    SCRAPE_INTERVAL = 1800
+    # Telegram errors meaning the account cannot read a channel at all
+    UNREADABLE_CHANNEL_ERRORS = (
+        ChannelInvalidError,
+        ChannelPrivateError,
+        UsernameInvalidError,
+        UsernameNotOccupiedError,
+    )
+    # Process-wide client, see get()
+    _instance = None
+
+    @classmethod
+    def get(cls) -> "TelegramJobClient":
+        """Return the shared client, creating it on first use
+
+        All callers in a process share one Telegram connection and one
+        session file.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        # Use a fixed path in the container for the session file
+        self.session_file = "/app/sessions/telegram_session"
+        # Ensure the sessions directory exists
+        os.makedirs(os.path.dirname(self.session_file), exist_ok=True)
+
+        logger.info(
+            "Initializing Telegram client with session file: %s", self.session_file
+        )
+
+        self.client = TelegramClient(
+            self.session_file,
+            TELEGRAM_API_ID,
+            TELEGRAM_API_HASH,
+            system_version="4.16.30-vxCUSTOM",
+            device_model="Desktop",
+            # Let Telethon recover dropped connections and short flood waits
+            connection_retries=5,
+            retry_delay=1,
+            auto_reconnect=True,
+            flood_sleep_threshold=60,
+        )
         self.monitoring = False
+        # Task running start_job_monitoring(), see start_monitoring()
+        self._monitor_task = None
         self.auth_retries = 0
         self.max_auth_retries = 3
+        # Monotonic time and result of the last authorization check
+        self._auth_checked_at = None
+        self._authorized = False
+        # Expiry (monotonic time) and names of the cached active channels
+        self._channels_cache = None
+        # Channel name -> (expiry, resolved input peer)
+        self._entity_cache = {}
+        # Channel name -> highest message id already scraped
+        self._last_message_ids = {}
+        # Telegram channel id -> channel name, for routing new message events
+        self._channel_names = {}
+        # Paces get_entity and history requests across all channels
+        self._rate_limiter = TokenBucket(rate=2.0, capacity=5, min_rate=0.125)
+
+    async def is_authorized(self, ttl: float = 10.0) -> bool:
+        """Check authorization, reusing the last result for up to ttl seconds"""
+        now = time.monotonic()
+        if self._auth_checked_at is None or now - self._auth_checked_at > ttl:
+            self._authorized = await self.client.is_user_authorized()
+            self._auth_checked_at = now
+        return self._authorized
 
     async def get_active_channels(self) -> List[str]:
-        """Get list of active channels from database"""
-        channels = (
-            self.db.query(TelegramChannel)
-            .filter(TelegramChannel.is_active == True)
-            .all()
-        )
-        return [channel.channel_name for channel in channels]
+        """Get list of active channels, cached for CHANNELS_CACHE_TTL seconds"""
+        now = time.monotonic()
+        if self._channels_cache is not None and self._channels_cache[0] > now:
+            return self._channels_cache[1]
+
+        rows = await asyncio.to_thread(self._load_active_channels)
+        names = [name for name, _ in rows]
+        # Pick up watermarks stored by earlier runs
+        for name, last_message_id in rows:
+            if last_message_id:
+                self._last_message_ids[name] = max(
+                    self._last_message_ids.get(name, 0), last_message_id
+                )
+        self._channels_cache = (now + self.CHANNELS_CACHE_TTL, names)
+        return names
+
+    def _load_active_channels(self) -> List[Tuple[str, Optional[int]]]:
+        """Query the names and stored watermarks of active channels"""
+        with SessionLocal() as db:
+            return db.execute(
+                select(
+                    TelegramChannel.channel_name, TelegramChannel.last_message_id
+                ).where(TelegramChannel.is_active == True)
+            ).all()
+
+    async def _get_entity(self, channel: str):
+        """Resolve a channel, reusing the result for ENTITY_CACHE_TTL seconds
+
+        Only the input peer is fetched; iter_messages needs nothing more than
+        the channel id and access hash.
+        """
+        now = time.monotonic()
+        cached = self._entity_cache.get(channel)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        await self._rate_limiter.acquire()
+        entity = await self.client.get_input_entity(channel)
+        self._entity_cache[channel] = (now + self.ENTITY_CACHE_TTL, entity)
+        channel_id = getattr(entity, "channel_id", None)
+        if channel_id is not None:
+            self._channel_names[channel_id] = channel
+        return entity
+
+    def invalidate_channels(self):
+        """Drop the cached channel list after channels were added or toggled"""
+        self._channels_cache = None
+
+    def start_monitoring(self) -> asyncio.Task:
+        """Run start_job_monitoring() in a task that stop() cancels"""
+        if self._monitor_task is None or self._monitor_task.done():
+            self._monitor_task = asyncio.create_task(self.start_job_monitoring())
+        return self._monitor_task
 
     async def start_job_monitoring(self):
-        """Start monitoring job channels"""
+        """Start monitoring job channels
+
+        Posts in joined channels are stored as they arrive through
+        _on_new_message. Every SCRAPE_INTERVAL the history of all active
+        channels is scraped from the last scraped message on; this is the
+        only source for channels the account reads without having joined,
+        and fills gaps left by disconnects in the others.
+        """
         self.monitoring = True
-        while self.monitoring:
-            try:
-                channels = await self.get_active_channels()
-                if not channels:
-                    print("No active channels configured in database")
-                    await asyncio.sleep(300)  # Wait 5 minutes before checking again
-                    continue
-
-                print(f"Found {len(channels)} active channels to monitor")
-                for channel in channels:
-                    try:
-                        await self._scrape_recent_jobs(channel)
-                    except Exception as e:
-                        print(f"Error scraping channel {channel}: {str(e)}")
-
-                # Wait for 30 minutes before next scrape
-                await asyncio.sleep(1800)
-            except Exception as e:
-                print(f"Error in job monitoring: {str(e)}")
-                await asyncio.sleep(60)  # Wait a minute before retrying
-
-    async def _scrape_recent_jobs(self, channel_name: str = None, limit: int = 50):
-        """Scrape recent jobs from specified channel or all channels"""
-        print("\n=== Starting Job Scraping ===")
-        print(f"Message limit per channel: {limit}")
+        handler_event = events.NewMessage(incoming=True)
+        self.client.add_event_handler(self._on_new_message, handler_event)
+        try:
+            while self.monitoring:
+                try:
+                    # Each cycle starts from the current channel list
+                    self.invalidate_channels()
+                    channels = await self.get_active_channels()
+                    if not channels:
+                        logger.info("No active channels configured in database")
+                        await asyncio.sleep(300)  # Wait 5 minutes before checking again
+                        continue
+
+                    logger.info("Found %s active channels to monitor", len(channels))
+                    await self._scrape_channels(channels)
+
+                    await asyncio.sleep(self.SCRAPE_INTERVAL)
+                except Exception:
+                    logger.exception("Error in job monitoring")
+                    await asyncio.sleep(60)  # Wait a minute before retrying
+        finally:
+            self.client.remove_event_handler(self._on_new_message, handler_event)
 
-        channels_to_scrape = (
-            [channel_name] if channel_name else await self.get_active_channels()
-        )
+    async def _on_new_message(self, event):
+        """Store a new post from an active channel as soon as it arrives
 
-        if not channels_to_scrape:
-            print("No channels configured for scraping!")
+        The watermark is left alone: posts missed during a disconnect have
+        lower ids, and the next history scrape has to start below them.
+        """
+        message = event.message
+        channel = self._channel_names.get(getattr(message.peer_id, "channel_id", None))
+        if channel is None or not message.message:
+            return
+        if channel not in await self.get_active_channels():
             return
 
-        for channel in channels_to_scrape:
-            try:
-                print(f"\n{'='*50}")
-                print(f"Processing channel: {channel}")
-                print(f"{'='*50}\n")
-
-                # Get channel entity
-                channel_entity = await self.client.get_entity(channel)
-                print(f"Successfully got entity for channel: {channel}")
-
-                # Update channel name in database with actual username
-                channel_record = (
-                    self.db.query(TelegramChannel)
-                    .filter(TelegramChannel.channel_name == channel)
-                    .first()
-                )
-                if channel_record:
-                    channel_record.last_scraped = datetime.utcnow()
-                    self.db.commit()
-
-                # Get recent messages
-                print(f"Fetching up to {limit} messages...")
-                messages = await self.client(
-                    GetHistoryRequest(
-                        peer=channel_entity,
-                        limit=limit,
-                        offset_date=None,
-                        offset_id=0,
-                        max_id=0,
-                        min_id=0,
-                        add_offset=0,
-                        hash=0,
+        try:
+            jobs = await asyncio.to_thread(self._parse_messages, [message])
+            new_jobs = await asyncio.to_thread(self._upsert_jobs, jobs)
+        except Exception:
+            logger.exception("Error storing message %s from %s", message.id, channel)
+            return
+        if new_jobs:
+            logger.info("Stored new job from %s", channel)
+
+    async def _scrape_channels(
+        self, channels: List[str], limit: int = 50
+    ) -> Dict[str, Union[int, Exception]]:
+        """Scrape channels concurrently
+
+        Returns each channel's number of new jobs, or the exception that
+        scraping it raised. last_scraped is set on the successful channels
+        with a single UPDATE.
+
+        At most CHANNEL_CONCURRENCY channels are in flight. A channel that
+        hits a flood wait sleeps it off without holding a slot and is retried
+        up to MAX_FLOOD_RETRIES times; waits longer than MAX_FLOOD_WAIT skip
+        the channel until the next scrape.
+        """
+        semaphore = asyncio.Semaphore(self.CHANNEL_CONCURRENCY)
+
+        async def scrape(channel):
+            for attempt in range(self.MAX_FLOOD_RETRIES + 1):
+                try:
+                    async with semaphore:
+                        result = await self._scrape_channel(channel, limit)
+                    self._rate_limiter.reset()
+                    return result
+                except FloodWaitError as e:
+                    self._rate_limiter.slow_down()
+                    if (
+                        attempt == self.MAX_FLOOD_RETRIES
+                        or e.seconds > self.MAX_FLOOD_WAIT
+                    ):
+                        raise
+                    logger.warning(
+                        "Flood wait on %s, retrying in %ss", channel, e.seconds
                     )
+                    await asyncio.sleep(e.seconds)
+
+        results = await asyncio.gather(
+            *(scrape(channel) for channel in channels),
+            return_exceptions=True,
+        )
+        scraped = []
+        for channel, result in zip(channels, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Error scraping channel %s", channel, exc_info=result
                 )
-                print(f"Fetched {len(messages.messages)} messages from {channel}")
-
-                job_count = 0
-                for message in messages.messages:
-                    print(f"\n{'-'*80}")
-                    print("MESSAGE CONTENT:")
-                    print(f"{'-'*80}")
-                    print(f"Message ID: {message.id}")
-                    print(f"Date: {message.date}")
-                    print(f"Content:\n{message.message}")
-                    print(f"{'-'*80}")
-
-                    if self._is_job_post(message.message):
-                        print(f"Found job post in message {message.id}")
-                        result = await self._process_message(message, "", None)
-                        if result:
-                            job_count += 1
-                            print(f"Successfully processed job: {result['title']}")
-                        else:
-                            print("Failed to process job post")
-                    else:
-                        print("Not a job post - skipping")
-
-                print(f"\nFinished processing {channel}. Found {job_count} jobs.")
+            else:
+                scraped.append(channel)
 
-            except Exception as e:
-                print(f"Error scraping channel {channel}: {str(e)}")
-                # Update channel status in database
-                channel_record = (
-                    self.db.query(TelegramChannel)
-                    .filter(TelegramChannel.channel_name == channel)
-                    .first()
+        if scraped:
+            watermarks = {
+                channel: self._last_message_ids.get(channel, 0) for channel in scraped
+            }
+            await asyncio.to_thread(self._mark_scraped, watermarks)
+        return dict(zip(channels, results))
+
+    def _mark_scraped(self, watermarks: Dict[str, int]):
+        """Set last_scraped and last_message_id on scraped channels with one UPDATE"""
+        with SessionLocal.begin() as db:
+            db.execute(
+                update(TelegramChannel)
+                .where(TelegramChannel.channel_name.in_(watermarks))
+                .values(
+                    last_scraped=datetime.utcnow(),
+                    last_message_id=case(
+                        watermarks,
+                        value=TelegramChannel.channel_name,
+                        else_=TelegramChannel.last_message_id,
+                    ),
                 )
-                if channel_record:
-                    print(f"Marking channel {channel} as inactive due to error")
-                    channel_record.is_active = False
-                    self.db.commit()
+            )
 
-        print("\n=== Job Scraping Complete ===\n")
+    async def _scrape_channel(self, channel: str, limit: int) -> int:
+        """Scrape one channel and return the number of new jobs stored
 
-    def _is_job_post(self, text: str) -> bool:
-        """Check if the message is likely a job post"""
-        if not text:
-            return False
-        text = text.lower()
-        matches = [keyword for keyword in self.job_keywords if keyword in text]
-        if matches:
-            print(f"Job keywords found: {matches}")
-            return True
-        return False
-
-    def _categorize_job(self, text: str) -> List[str]:
-        """Categorize job based on technologies and keywords"""
-        text = text.lower()
-        categories = []
-        for category, keywords in self.tech_categories.items():
-            if any(keyword in text for keyword in keywords):
-                categories.append(category)
-        return categories
-
-    async def _process_message(
-        self, message, search_title: str, location: Optional[str]
-    ) -> Optional[Dict]:
-        """Process a Telegram message into a job posting"""
-        try:
-            print(f"\nProcessing message ID: {message.id}")
-            print(f"Message date: {message.date}")
-            print(f"Channel ID: {message.peer_id.channel_id}")
+        A channel that does not exist or cannot be read is deactivated. Every
+        error, including database failures, is raised to the caller; those
+        leave the channel active.
+        """
+        logger.debug("Processing channel: %s", channel)
 
-            # Extract relevant information from the message
-            text = message.message
-            lines = text.split("\n")
-
-            # Try to extract title
-            title = next(
-                (
-                    line
-                    for line in lines
-                    if any(keyword in line.lower() for keyword in self.job_keywords)
-                ),
-                lines[0],
+        # Get channel entity; ValueError means no such entity exists
+        try:
+            channel_entity = await self._get_entity(channel)
+        except (ValueError, *self.UNREADABLE_CHANNEL_ERRORS):
+            await self._disable_channel(channel)
+            raise
+        logger.debug("Successfully got entity for channel: %s", channel)
+
+        # Stream the messages posted since the last scrape, oldest first,
+        # so a backlog longer than limit is drained over several scrapes
+        # instead of skipped. The first scrape of a channel has no
+        # watermark and takes the newest limit messages instead.
+        # Classification and parsing are pure Python, so each page goes
+        # to a worker thread while the next one is fetched and the
+        # Telethon connection keeps being served.
+        logger.debug("Fetching up to %s messages", limit)
+        parse_tasks = []
+        page = []
+        fetched = 0
+        last_message_id = self._last_message_ids.get(channel, 0)
+        newest_message_id = last_message_id
+        try:
+            await self._rate_limiter.acquire()
+            async for message in self.client.iter_messages(
+                channel_entity,
+                limit=limit,
+                min_id=last_message_id,
+                reverse=bool(last_message_id),
+            ):
+                fetched += 1
+                newest_message_id = max(newest_message_id, message.id)
+                # Skip service and media-only messages, which have no text
+                if not getattr(message, "message", None):
+                    continue
+                page.append(message)
+                if len(page) == self.PARSE_PAGE_SIZE:
+                    parse_tasks.append(self._start_parsing(page))
+                    page = []
+        except self.UNREADABLE_CHANNEL_ERRORS:
+            await self._disable_channel(channel)
+            raise
+        if page:
+            parse_tasks.append(self._start_parsing(page))
+        logger.debug("Fetched %s messages from %s", fetched, channel)
+
+        parsed_jobs = [
+            job for jobs in await asyncio.gather(*parse_tasks) for job in jobs
+        ]
+
+        # One write per channel instead of one per message, made from a
+        # worker thread so the event loop keeps serving other channels
+        new_jobs = await asyncio.to_thread(self._upsert_jobs, parsed_jobs)
+        self._last_message_ids[channel] = newest_message_id
+        logger.info(
+            "Finished processing %s. Found %s jobs, %s new",
+            channel,
+            len(parsed_jobs),
+            new_jobs,
+        )
+        return new_jobs
+
+    async def _disable_channel(self, channel: str):
+        """Deactivate a channel the account cannot read"""
+        if await asyncio.to_thread(self._deactivate_channel, channel):
+            logger.warning("Marking channel %s as inactive due to error", channel)
+            self.invalidate_channels()
+
+    def _deactivate_channel(self, channel: str) -> bool:
+        """Mark a channel inactive and return whether it existed"""
+        with SessionLocal.begin() as db:
+            return bool(
+                db.execute(
+                    update(TelegramChannel)
+                    .where(TelegramChannel.channel_name == channel)
+                    .values(is_active=False)
+                ).rowcount
             )
-            print(f"Extracted title: {title}")
 
-            # Create unique job ID
-            job_id = f"tg_{message.id}_{message.peer_id.channel_id}"
-            print(f"Generated job ID: {job_id}")
-
-            # Check for existing job first
-            print(f"Checking for existing job with ID: {job_id}")
-            existing_job = self.db.query(Job).filter(Job.job_id == job_id).first()
-            if existing_job:
-                print(
-                    f"Found existing job in database. Last updated: {existing_job.updated_at}"
+    def _keyword_matcher(self):
+        """Return the Aho-Corasick automaton over all job and tech keywords
+
+        Each keyword maps to the (kind, category) pairs it stands for, kind
+        being "job", "tech" or "flag". The automaton is built once and shared by all
+        clients.
+        """
+        cls = type(self)
+        if cls._keyword_automaton is None:
+            payloads = {}
+            for keyword in self.JOB_KEYWORDS:
+                payloads.setdefault(keyword, []).append(("job", None))
+            for category, keywords in self.TECH_CATEGORIES.items():
+                for keyword in keywords:
+                    payloads.setdefault(keyword, []).append(("tech", category))
+            for keyword in self.FLAG_KEYWORDS:
+                payloads.setdefault(keyword, []).append(("flag", keyword))
+
+            automaton = ahocorasick.Automaton()
+            for keyword, payload in payloads.items():
+                automaton.add_word(keyword, (keyword, tuple(payload)))
+            automaton.make_automaton()
+            cls._keyword_automaton = automaton
+        return cls._keyword_automaton
+
+    def _classify(self, text_lower: str):
+        """Find job keywords and tech categories in lowercased text with a single scan
+
+        Returns the matched job keywords, the categories in the order of
+        TECH_CATEGORIES, the index of the first line with a job keyword
+        (0 if there is none) and the set of FLAG_KEYWORDS present.
+        """
+        if not text_lower:
+            return [], [], 0, set()
+        job_matches = []
+        found_categories = set()
+        flags = set()
+        first_job_end = None
+        for end, (keyword, payload) in self._keyword_matcher().iter(text_lower):
+            for kind, category in payload:
+                if kind == "job":
+                    if first_job_end is None:
+                        first_job_end = end
+                    if keyword not in job_matches:
+                        job_matches.append(keyword)
+                elif kind == "flag":
+                    flags.add(category)
+                else:
+                    found_categories.add(category)
+        categories = [
+            category
+            for category in self.TECH_CATEGORIES
+            if category in found_categories
+        ]
+        # Matches come in text order and never span lines, so the first one
+        # sits on the first line that has any job keyword
+        title_line = (
+            text_lower.count("\n", 0, first_job_end) if first_job_end is not None else 0
+        )
+        return job_matches, categories, title_line, flags
+
+    def _start_parsing(self, messages) -> asyncio.Task:
+        """Start parsing messages in a worker thread"""
+        return asyncio.create_task(asyncio.to_thread(self._parse_messages, messages))
+
+    def _parse_messages(self, messages) -> List[Dict]:
+        """Classify messages and parse the job posts among them"""
+        parsed_jobs = []
+        log_messages = logger.isEnabledFor(logging.DEBUG)
+        for message in messages:
+            if log_messages:
+                logger.debug(
+                    "Message %s (%s):\n%s", message.id, message.date, message.message
                 )
 
-            # Try to extract company name
-            company_pattern = r"(?i)(?:at|@|company:?)\s*([A-Za-z0-9\s]+(?:Inc\.?|LLC|Ltd\.?|Limited|Corp\.?|Corporation)?)"
-            company_match = re.search(company_pattern, text)
-            company_name = (
-                company_match.group(1) if company_match else "Unknown Company"
-            )
-            print(f"Extracted company: {company_name}")
-
-            # Try to extract location
-            location_pattern = r"(?i)(?:location:?|based in:?|remote|on-site|hybrid)\s*([A-Za-z0-9\s,]+)"
-            location_match = re.search(location_pattern, text)
-            job_location = (
-                location_match.group(1)
-                if location_match
-                else location or "Location not specified"
-            )
-            print(f"Extracted location: {job_location}")
+            text_lower = (message.message or "").lower()
+            classification = self._classify(text_lower)
+            job_matches = classification[0]
+            if job_matches:
+                logger.debug(
+                    "Found job post in message %s, keywords: %s",
+                    message.id,
+                    job_matches,
+                )
+                job = self._parse_message(message, None, classification, text_lower)
+                if job:
+                    parsed_jobs.append(job)
+                    logger.debug("Successfully parsed job: %s", job["title"])
+                else:
+                    logger.debug("Failed to parse job post")
+            else:
+                logger.debug("Not a job post - skipping")
+        return parsed_jobs
+
+    def _parse_message(
+        self,
+        message,
+        location: Optional[str] = None,
+        classification: Optional[tuple] = None,
+        text_lower: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """Parse a Telegram message into Job column values, without touching the database"""
+        try:
+            # Extract relevant information from the message
+            text = message.message
+            if text_lower is None:
+                text_lower = text.lower()
+            if classification is None:
+                classification = self._classify(text_lower)
+            _, categories, title_line, flags = classification
 
-            # Try to extract salary
-            salary_pattern = (
-                r"(?i)(?:salary:?|compensation:?|pay:?)\s*([A-Za-z0-9\s\$\-\,]+)"
-            )
-            salary_match = re.search(salary_pattern, text)
-            salary_text = salary_match.group(1) if salary_match else None
-            print(f"Extracted salary text: {salary_text}")
+            # Use the first line mentioning a job keyword as the title.
+            # Lowercasing keeps the line breaks, so the line index found in
+            # text_lower points at the same line of text.
+            title = text.split("\n", title_line + 1)[title_line]
 
-            # Categorize job
-            categories = self._categorize_job(text)
-            print(f"Categorized as: {categories}")
+            # Create unique job ID
+            channel_id = message.peer_id.channel_id
+            job_id = f"tg_{message.id}_{channel_id}"
+
+            # Try to extract company name, location and salary
+            company_name, job_location, salary_text = _extract_fields(text)
+            company_name = company_name or "Unknown Company"
+            job_location = job_location or location or "Location not specified"
+            salary_min, salary_max = self._extract_salary_range(salary_text)
+
+            logger.debug(
+                "Parsed %s: title=%r company=%r location=%r salary=%r categories=%s",
+                job_id,
+                title,
+                company_name,
+                job_location,
+                salary_text,
+                categories,
+            )
 
-            # Collect all available message metadata
+            # Message metadata that has no column of its own
+            date = message.date
             metadata = {
-                "message_id": message.id,
-                "from_id": message.from_id.user_id if message.from_id else None,
-                "peer_id": message.peer_id.channel_id,
-                "date": message.date.isoformat() if message.date else None,
+                "from_id": getattr(message.from_id, "user_id", None),
                 "post": message.post,
-                "post_author": (
-                    message.post_author if hasattr(message, "post_author") else None
-                ),
-                "views": message.views if hasattr(message, "views") else None,
-                "forwards": message.forwards if hasattr(message, "forwards") else None,
-                "replies": (
-                    message.replies.replies if hasattr(message, "replies") else None
-                ),
-                "edit_date": (
-                    message.edit_date.isoformat()
-                    if hasattr(message, "edit_date") and message.edit_date
-                    else None
-                ),
-                "has_media": (
-                    bool(message.media) if hasattr(message, "media") else False
-                ),
-                "grouped_id": (
-                    message.grouped_id if hasattr(message, "grouped_id") else None
-                ),
+                "post_author": message.post_author,
+                "replies": message.replies.replies if message.replies else None,
+                "edit_date": message.edit_date,
+                "has_media": bool(message.media),
+                "grouped_id": message.grouped_id,
             }
-            print(f"Collected metadata: {metadata}")
 
-            print("Creating job object...")
-            # Store in database
-            job = Job(
+            return dict(
                 job_id=job_id,
                 title=title[:255],
                 company_name=company_name[:255],
                 location=job_location[:255],
-                description=text,
-                url=f"https://t.me/c/{message.peer_id.channel_id}/{message.id}",
-                remote="remote" in text.lower(),
-                salary_min=(
-                    self._extract_salary_min(salary_text) if salary_text else None
-                ),
-                salary_max=(
-                    self._extract_salary_max(salary_text) if salary_text else None
-                ),
+                url=f"https://t.me/c/{channel_id}/{message.id}",
+                remote="remote" in flags,
+                salary_min=salary_min,
+                salary_max=salary_max,
                 currency="USD",  # Default currency
                 categories=categories,
-                created_at=message.date,
+                created_at=date,
                 # New Telegram specific fields
                 telegram_message_id=message.id,
-                telegram_channel_id=message.peer_id.channel_id,
-                telegram_channel_name=str(
-                    message.peer_id.channel_id
-                ),  # We'll update this later with actual name
-                telegram_message_date=message.date,
-                telegram_views=message.views if hasattr(message, "views") else None,
-                telegram_forwards=(
-                    message.forwards if hasattr(message, "forwards") else None
-                ),
+                telegram_channel_id=channel_id,
+                # We'll update this later with actual name
+                telegram_channel_name=str(channel_id),
+                telegram_message_date=date,
+                telegram_views=message.views,
+                telegram_forwards=message.forwards,
                 telegram_raw_text=text,
                 telegram_metadata=metadata,
             )
 
-            if existing_job:
-                print("Updating existing job...")
-                # Update existing job
-                for key, value in job.__dict__.items():
-                    if key != "_sa_instance_state" and value is not None:
-                        setattr(existing_job, key, value)
-                existing_job.updated_at = datetime.utcnow()
-                job = existing_job
-                print(f"Job updated. New update time: {job.updated_at}")
-            else:
-                print("Adding new job to database...")
-                self.db.add(job)
-
-            print("Committing to database...")
-            try:
-                self.db.commit()
-                print("Successfully committed to database!")
-                self.db.refresh(job)
-                print(f"Job refreshed. ID: {job.job_id}, Title: {job.title}")
-                return {
-                    "id": job.job_id,
-                    "title": job.title,
-                    "company": job.company_name,
-                    "location": job.location,
-                    "description": job.description,
-                    "url": job.url,
-                    "remote": job.remote,
-                    "salary_min": job.salary_min,
-                    "salary_max": job.salary_max,
-                    "currency": job.currency,
-                    "categories": job.categories,
-                    "telegram_metadata": metadata,
-                }
-            except Exception as e:
-                print(f"Error committing to database: {str(e)}")
-                self.db.rollback()
-                raise
-
         except Exception as e:
-            print(f"Error processing Telegram message: {str(e)}")
-            print("Rolling back database transaction...")
-            self.db.rollback()
+            logger.warning("Error parsing Telegram message %s: %s", message.id, e)
             return None
 
-    def _extract_salary_min(self, salary_str: Optional[str]) -> Optional[float]:
-        """Extract minimum salary from salary string"""
+    def _upsert_jobs(self, jobs: List[Dict]) -> int:
+        """Store parsed jobs with a single upsert and return how many were new"""
+        if not jobs:
+            return 0
+
+        # A statement may not upsert the same row twice; the last parse wins
+        jobs = list({values["job_id"]: values for values in jobs}.values())
+        stmt = insert(Job).values(jobs)
+        # Re-scraped jobs keep stored values the new parse didn't find
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Job.job_id],
+            set_={
+                **{
+                    key: func.coalesce(stmt.excluded[key], Job.__table__.c[key])
+                    for key in jobs[0]
+                    if key != "job_id"
+                },
+                "updated_at": datetime.utcnow(),
+            },
+        ).returning(literal_column("xmax = 0"))  # true for inserted rows
+
+        # A short transaction per channel; the connection goes back to the
+        # pool as soon as the upsert is committed
+        with SessionLocal.begin() as db:
+            new_jobs = sum(db.execute(stmt).scalars())
+
+        logger.debug("Stored %s jobs, %s new", len(jobs), new_jobs)
+        return new_jobs
+
+    def _extract_salary_range(
+        self, salary_str: Optional[str]
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """Extract the minimum and maximum salary from a salary string
+
+        The maximum is only set when the string holds more than one number.
+        """
         if not salary_str:
-            return None
-        try:
-            # Remove currency symbols and commas
-            cleaned = re.sub(r"[^\d\-\s]", "", salary_str)
-            # Find first number in string
-            match = re.search(r"\d+", cleaned)
-            if match:
-                return float(match.group())
-        except:
-            return None
-
-    def _extract_salary_max(self, salary_str: Optional[str]) -> Optional[float]:
-        """Extract maximum salary from salary string"""
-        if not salary_str:
-            return None
-        try:
-            # Remove currency symbols and commas
-            cleaned = re.sub(r"[^\d\-\s]", "", salary_str)
-            # Find all numbers in string
-            numbers = re.findall(r"\d+", cleaned)
-            if len(numbers) > 1:
-                return float(numbers[-1])
-        except:
-            return None
-
-    def __del__(self):
-        """Cleanup"""
-        self.db.close()
-        if self.client.is_connected():
-            import asyncio
-
-            asyncio.run(self.client.disconnect())
+            return None, None
+        # Remove currency symbols and commas, then find all numbers
+        numbers = NUMBER_RE.findall(SALARY_CLEANUP_RE.sub("", salary_str))
+        if not numbers:
+            return None, None
+        return float(numbers[0]), (float(numbers[-1]) if len(numbers) > 1 else None)
 
     async def start(self):
         """Start the client and ensure authentication"""
         try:
-            print("\n=== Starting Telegram Client ===")
-            print(f"Session file path: {self.session_file}")
-            print(
-                f"Session file exists: {os.path.exists(f'{self.session_file}.session')}"
+            session_exists = os.path.exists(f"{self.session_file}.session")
+            logger.info(
+                "Starting Telegram client, session file %s exists: %s",
+                self.session_file,
+                session_exists,
             )
 
             await self.client.connect()
 
             # Check if we're already authorized
-            is_authorized = await self.client.is_user_authorized()
-            print(f"Client authorized: {is_authorized}")
-
+            self._auth_checked_at = None
+            is_authorized = await self.is_authorized()
             if is_authorized:
-                print("Successfully loaded existing session")
+                logger.info("Successfully loaded existing session")
                 return True
 
             # If we're not authorized and have a session file, something is wrong
-            if os.path.exists(f"{self.session_file}.session"):
-                print("Warning: Session file exists but client is not authorized")
-                print("This might indicate a corrupted or invalid session")
+            if session_exists:
+                logger.warning(
+                    "Session file exists but client is not authorized; "
+                    "the session might be corrupted or invalid"
+                )
                 return False
 
             # No valid session, need to authenticate
             phone = os.getenv("TELEGRAM_PHONE")
             if not phone:
-                print("TELEGRAM_PHONE environment variable not set")
+                logger.error("TELEGRAM_PHONE environment variable not set")
                 return False
 
-            print(
-                f"No valid session found. Attempting to authenticate with phone number: {phone}"
+            logger.info(
+                "No valid session found. Attempting to authenticate with phone number: %s",
+                phone,
             )
             result = await self.client.send_code_request(phone)
             phone_code_hash = result.phone_code_hash
-            print("Verification code has been sent. Please run:")
-            print(
-                f'docker exec -it show-me-your-cv-app-1 python3 -c \'from src.telegram_client import TelegramJobClient; import asyncio; asyncio.run(TelegramJobClient().enter_code("{phone}", "{phone_code_hash}"))\''
+            logger.warning(
+                "Verification code has been sent. Please run:\n%s",
+                f'docker exec -it show-me-your-cv-app-1 python3 -c \'from src.telegram_client import TelegramJobClient; import asyncio; asyncio.run(TelegramJobClient().enter_code("{phone}", "{phone_code_hash}"))\'',
             )
             return False
 
-        except Exception as e:
-            print(f"Error during Telegram authentication: {str(e)}")
+        except Exception:
+            logger.exception("Error during Telegram authentication")
             return False
 
-    async def enter_code(self, phone, phone_code_hash):
-        """Helper method to enter verification code"""
+    async def enter_code(self, phone, phone_code_hash, code: Optional[str] = None):
+        """Helper method to enter verification code
+
+        Without a code the user is prompted for one; the prompt runs in a
+        worker thread so the event loop keeps serving other tasks.
+        """
         try:
             print("\n=== Starting Telegram Authentication ===")
             print(f"Phone number: {phone}")
@@ -486,7 +792,11 @@ class TelegramJobClient:
                 print("Already authenticated!")
                 return
 
-            code = input("Please enter the verification code you received: ").strip()
+            if code is None:
+                code = await asyncio.to_thread(
+                    input, "Please enter the verification code you received: "
+                )
+            code = code.strip()
             if not code:
                 print("Error: Code cannot be empty")
                 return
@@ -498,6 +808,7 @@ class TelegramJobClient:
                 await self.client.sign_in(
                     phone=phone, code=code, phone_code_hash=phone_code_hash
                 )
+                self._auth_checked_at = None
                 print("Authentication successful!")
             except Exception as e:
                 print(f"Error during sign in: {str(e)}")
@@ -509,6 +820,23 @@ class TelegramJobClient:
             print("=== Authentication Process Complete ===\n")
 
     async def stop(self):
-        """Stop the client"""
+        """Stop monitoring and disconnect the client"""
         self.monitoring = False
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            try:
+                await self._monitor_task
+            except asyncio.CancelledError:
+                pass
+            self._monitor_task = None
+        self._auth_checked_at = None
         await self.client.disconnect()
+        if type(self)._instance is self:
+            type(self)._instance = None
+
+    async def __aenter__(self) -> "TelegramJobClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
@@ -1,8 +1,8 @@
 import os
+import atexit
 import logging
 import asyncio
 import threading
-import nest_asyncio
 from telethon import TelegramClient as TelethonClient
 from telethon.tl.functions.messages import GetHistoryRequest
 from django.conf import settings
@@ -10,6 +10,11 @@ from job_scraper.models import Job
 from django.utils import timezone
 from asgiref.sync import sync_to_async
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 class TelegramClient:
@@ -17,8 +22,17 @@ class TelegramClient:
     _phone_code_hash = None
     _lock = threading.Lock()
     _loop = None
+    _loop_thread = None
     _needs_verification = False
     _is_connected = False
+    # Channels scraped at the same time by scrape_channels()
+    CHANNEL_CONCURRENCY = 4
+    # Job fields a re-scraped message overwrites
+    JOB_UPDATE_FIELDS = [
+        'title', 'description', 'telegram_message_id', 'telegram_channel_id',
+        'telegram_channel_name', 'telegram_message_date', 'telegram_views',
+        'telegram_forwards', 'telegram_raw_text', 'url', 'updated_at'
+    ]
     
     def __new__(cls):
         if cls._instance is None:
@@ -26,9 +40,15 @@ class TelegramClient:
                 if cls._instance is None:
                     cls._instance = super(TelegramClient, cls).__new__(cls)
                     cls._instance._initialized = False
-                    cls._loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(cls._loop)
-                    nest_asyncio.apply(cls._loop)
+                    # All Telethon work runs on one loop in a background thread;
+                    # request threads submit coroutines to it and wait
+                    cls._loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+                    cls._loop_thread = threading.Thread(
+                        target=cls._loop.run_forever,
+                        name="telegram-client-loop",
+                        daemon=True
+                    )
+                    cls._loop_thread.start()
         return cls._instance
 
     def __init__(self):
@@ -37,75 +57,80 @@ class TelegramClient:
             
         with self._lock:
             if not self._initialized:
-                session_file = os.path.join(settings.TELEGRAM_SESSION_DIR, "scraper")
-                self.client = TelethonClient(
-                    session_file,
-                    settings.TELEGRAM_API_ID,
-                    settings.TELEGRAM_API_HASH,
-                    loop=self._loop
-                )
+                # Telethon binds to the loop current at construction, which
+                # only exists on the loop thread, so build the client there
+                self.client = self._run_async(self._create_client())
+                # Channel name -> resolved entity, kept for the client's lifetime
+                self._entity_cache = {}
                 self._initialized = True
+                # Disconnect while the loop thread is still alive
+                atexit.register(self.close)
                 try:
                     self._run_async(self._connect())
                 except Exception as e:
                     logger.error(f"Failed to connect during initialization: {str(e)}")
 
+    async def _create_client(self):
+        """Build the Telethon client on the loop thread"""
+        session_file = os.path.join(settings.TELEGRAM_SESSION_DIR, "scraper")
+        return TelethonClient(
+            session_file,
+            settings.TELEGRAM_API_ID,
+            settings.TELEGRAM_API_HASH
+        )
+
     @sync_to_async
-    def _save_job(self, job_id, defaults):
-        """Save job to database"""
+    def _save_jobs(self, jobs):
+        """Upsert jobs in one statement and return how many were new"""
+        if not jobs:
+            return 0
         try:
-            job, created = Job.objects.update_or_create(
-                job_id=job_id,
-                defaults=defaults
+            job_ids = {job.job_id for job in jobs}
+            existing = set(
+                Job.objects.filter(job_id__in=job_ids).values_list('job_id', flat=True)
+            )
+            Job.objects.bulk_create(
+                jobs,
+                update_conflicts=True,
+                unique_fields=['job_id'],
+                update_fields=self.JOB_UPDATE_FIELDS
             )
-            return created
+            return len(job_ids - existing)
         except Exception as e:
-            logger.error(f"Database error saving job {job_id}: {str(e)}")
-            return False
+            logger.error(f"Database error saving {len(jobs)} jobs: {str(e)}")
+            return 0
 
-    async def _process_job_post(self, channel_id, channel_name, message):
-        """Process and store a job post"""
-        try:
-            # Remove @ from channel name if present
-            clean_channel_name = channel_name.lstrip('@')
-            job_id = f"{clean_channel_name}_{message['id']}"
-            
-            logger.info(f"Processing job post: {job_id}")
-            logger.info(f"Message content: {message['text'][:100]}...")  # Log first 100 chars
-            
-            defaults = {
-                'title': message['text'][:255],
-                'description': message['text'],
-                'telegram_message_id': message['id'],
-                'telegram_channel_id': channel_id,
-                'telegram_channel_name': clean_channel_name,
-                'telegram_message_date': message['date'],
-                'telegram_views': message['views'],
-                'telegram_forwards': message['forwards'],
-                'telegram_raw_text': message['text'],
-                'url': f"https://t.me/{clean_channel_name}/{message['id']}"
-            }
-            
-            logger.info(f"Attempting to create/update job with ID: {job_id}")
-            created = await self._save_job(job_id, defaults)
-            
-            if created:
-                logger.info(f"Created new job: {job_id}")
-            else:
-                logger.info(f"Updated existing job: {job_id}")
-            
-            return created
-            
-        except Exception as e:
-            logger.error(f"Error processing job post: {str(e)}")
-            logger.error(f"Job data: channel_id={channel_id}, channel_name={channel_name}, message_id={message.get('id')}")
-            return False
+    def _build_job(self, channel_id, channel_name, message):
+        """Build an unsaved Job from a job post"""
+        # Remove @ from channel name if present
+        clean_channel_name = channel_name.lstrip('@')
+        return Job(
+            job_id=f"{clean_channel_name}_{message['id']}",
+            title=message['text'][:255],
+            description=message['text'],
+            telegram_message_id=message['id'],
+            telegram_channel_id=channel_id,
+            telegram_channel_name=clean_channel_name,
+            telegram_message_date=message['date'],
+            telegram_views=message['views'],
+            telegram_forwards=message['forwards'],
+            telegram_raw_text=message['text'],
+            url=f"https://t.me/{clean_channel_name}/{message['id']}"
+        )
+
+    async def _resolved_entity(self, channel_name):
+        """Resolve a channel once and reuse the entity on later scrapes"""
+        entity = self._entity_cache.get(channel_name)
+        if entity is None:
+            entity = await self.client.get_entity(channel_name)
+            self._entity_cache[channel_name] = entity
+        return entity
 
     async def _get_channel_messages(self, channel_name, limit=100):
         """Get messages from a channel"""
         try:
             await self._ensure_connected()
-            channel = await self.client.get_entity(channel_name)
+            channel = await self._resolved_entity(channel_name)
             
             messages = []
             async for message in self.client.iter_messages(channel, limit=limit):
@@ -114,8 +139,9 @@ class TelegramClient:
                         'id': message.id,
                         'text': message.message,
                         'date': message.date,
-                        'views': getattr(message, 'views', 0),
-                        'forwards': getattr(message, 'forwards', 0)
+                        # Telethon leaves these None when Telegram omits them
+                        'views': message.views or 0,
+                        'forwards': message.forwards or 0
                     })
             
             return channel.id, messages
@@ -132,14 +158,29 @@ class TelegramClient:
         channel_id, messages = await self._get_channel_messages(channel_name)
         logger.info(f"Retrieved {len(messages)} messages from channel {channel_name}")
         
-        new_jobs_count = 0
-        for message in messages:
-            if await self._process_job_post(channel_id, channel_name, message):
-                new_jobs_count += 1
+        # One upsert for the whole channel instead of one query per message
+        jobs = [self._build_job(channel_id, channel_name, message) for message in messages]
+        new_jobs_count = await self._save_jobs(jobs)
         
         logger.info(f"Finished scraping channel {channel_name}. Added {new_jobs_count} new jobs.")
         return new_jobs_count
 
+    async def _scrape_channels_async(self, channel_names):
+        """Scrape channels concurrently, at most CHANNEL_CONCURRENCY at a time"""
+        # Authorize once up front instead of racing from every channel
+        await self._ensure_connected()
+        semaphore = asyncio.Semaphore(self.CHANNEL_CONCURRENCY)
+
+        async def scrape(channel_name):
+            async with semaphore:
+                return await self._scrape_channel_async(channel_name)
+
+        results = await asyncio.gather(
+            *(scrape(channel_name) for channel_name in channel_names),
+            return_exceptions=True
+        )
+        return dict(zip(channel_names, results))
+
     async def _connect(self):
         """Connect and check authorization status"""
         try:
@@ -192,9 +233,13 @@ class TelegramClient:
                 raise ValueError("Authentication required")
 
     def _run_async(self, coro):
-        """Run a coroutine in the event loop"""
+        """Run a coroutine on the client's loop thread and wait for its result"""
+        if self._loop is None or not self._loop.is_running():
+            # Submitting to a stopped loop would block forever on the result
+            coro.close()
+            raise RuntimeError("Telegram client is closed")
         try:
-            return self._loop.run_until_complete(coro)
+            return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
         except Exception as e:
             logger.error(f"Error in async operation: {str(e)}")
             raise
@@ -207,6 +252,14 @@ class TelegramClient:
         """Scrape jobs from a channel"""
         return self._run_async(self._scrape_channel_async(channel_name))
 
+    def scrape_channels(self, channel_names):
+        """Scrape jobs from several channels concurrently
+
+        Returns a dict mapping each channel name to its number of new jobs,
+        or to the exception scraping it raised.
+        """
+        return self._run_async(self._scrape_channels_async(list(channel_names)))
+
     def needs_verification(self):
         """Check if verification is needed"""
         return self._needs_verification
@@ -215,10 +268,30 @@ class TelegramClient:
         """Check if client is connected and authorized"""
         return self._is_connected
 
-    def __del__(self):
-        """Cleanup"""
-        if hasattr(self, 'client') and self.client.is_connected():
+    async def _disconnect(self):
+        """Disconnect the Telethon client on the loop thread"""
+        if self.client.is_connected():
+            await self.client.disconnect()
+
+    def close(self):
+        """Disconnect from Telegram and stop the loop thread.
+
+        The next TelegramClient() builds a fresh client with its own loop.
+        """
+        cls = type(self)
+        with cls._lock:
+            # A replaced instance must not stop its successor's loop
+            if cls._instance is not self or not self._loop.is_running():
+                return
             try:
-                self._run_async(self.client.disconnect())
-            except:
-                pass 
\ No newline at end of file
+                self._run_async(self._disconnect())
+            except Exception as e:
+                logger.error(f"Error disconnecting Telegram client: {str(e)}")
+            finally:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop_thread.join(timeout=5)
+                self._is_connected = False
+                cls._instance = None
+                cls._loop = None
+                cls._loop_thread = None
+